@@ -0,0 +1,22 @@
+'''
+PyWordle: a Wordle clone in PyGame, with the game rules, word lists, solver
+and tooling as modules that can be used without the game.
+
+Importing the package loads nothing else. Submodules are imported when
+they are first used, so `pywordle.engine` can be used by tools without
+loading pygame, and pygame (like numpy, for the solver) is only loaded by
+the modules that draw. Run `python -m pywordle --help` for the commands.
+'''
+import importlib
+
+
+def __getattr__(name):
+    ''' Import submodules on first access, e.g. pywordle.engine '''
+    if name.startswith("_"):
+        raise AttributeError(name)
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
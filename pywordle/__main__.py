@@ -0,0 +1,48 @@
+'''
+Command line entry point:
+
+    python -m pywordle play --hard          # the game
+    python -m pywordle solve crane:..y.g    # suggest the next guess
+    python -m pywordle bench
+    python -m pywordle serve --port 8765
+
+Each command's module is only imported when that command is run, so
+`python -m pywordle --help` and the commands that don't draw never load
+pygame. Anything after the command is passed to it; add --help after a
+command to see its options.
+'''
+import argparse
+import importlib
+import sys
+
+
+# Command name: (module, description)
+COMMANDS = {"play": ("main", "play the game"),
+            "solve": ("solver", "suggest the next guess from the feedback so far"),
+            "bench": ("bench", "benchmark the hot paths and the import time"),
+            "serve": ("server", "host games over TCP"),
+            "loadtest": ("loadtest", "load test a running server"),
+            "evaluate": ("evaluate", "score a solver strategy over every answer"),
+            "stats": ("stats", "show a player's saved stats"),
+            "replay": ("replay", "play back recorded games"),
+            "daily": ("daily", "show and precompute the daily puzzles"),
+            "pack": ("wordpack", "compile the word lists into a word pack")}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pywordle", description="PyWordle",
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog="commands:\n" + "\n".join(f"  {name:<10}{description}"
+                                                                       for name, (_, description) in COMMANDS.items()))
+    parser.add_argument("command", choices=COMMANDS, metavar="command")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="options for the command")
+    args = parser.parse_args(argv)
+
+    module = importlib.import_module(f".{COMMANDS[args.command][0]}", __package__)
+    # The command's own argparse usage and errors are named after it
+    sys.argv[0] = f"{parser.prog} {args.command}"
+    return module.main(args.args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
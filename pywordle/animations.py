@@ -0,0 +1,129 @@
+'''
+Pre-rendered animation frames. Each tile animation is drawn once per
+(letter, colour, size) into a sprite sheet, and playing it back is a single
+blit per frame, so animations don't allocate surfaces or copy the screen.
+Every frame is drawn over the background colour and covers the whole area
+the animation touches, so blitting a frame also erases the previous one.
+'''
+import pygame
+from . import config as cfg
+from . import glyphs
+from . import sprites
+
+
+class FrameSheet:
+    ''' A row of equally sized animation frames stored in one Surface '''
+    def __init__(self, frame_width, frame_height, n_frames, offset=(0, 0)):
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.n_frames = n_frames
+        # Position of each frame relative to the top-left of the tile
+        self.offset = offset
+        self.sheet = pygame.Surface((frame_width * n_frames, frame_height))
+        self.sheet.fill(cfg.BGCOLOUR)
+
+
+    def __len__(self):
+        return self.n_frames
+
+
+    def frame_area(self, index):
+        return pygame.Rect(index * self.frame_width, 0, self.frame_width, self.frame_height)
+
+
+    def blit(self, screen, x, y, index):
+        ''' Draw frame index for a tile at (x, y) and return the rect it covered '''
+        dest = (x + self.offset[0], y + self.offset[1])
+        return screen.blit(self.sheet, dest, self.frame_area(index))
+
+
+def shake_offsets(move_amount=cfg.ROW_MOVE_AMOUNT, move_step=cfg.ROW_MOVE_STEP):
+    '''
+    Return the x offset of a shaking row for each frame: move right then
+    left, reducing the maximum displacement each time until the row is back
+    at rest.
+    '''
+    offsets = []
+    x = 0
+    while move_amount >= 0:
+        while x < move_amount:
+            x += move_step
+            offsets.append(x)
+        while x > -move_amount:
+            x -= move_step
+            offsets.append(x)
+        move_amount -= 2
+    if not offsets or offsets[-1] != 0:
+        offsets.append(0)
+    return tuple(offsets)
+
+
+def flip_heights(size, step=cfg.FLIP_STEP):
+    ''' Return the visible tile height for each frame of a flip '''
+    shrinking = list(range(size - step, 0, -step))
+    return tuple(shrinking + [0] + shrinking[::-1] + [size])
+
+
+def tile_glyph(letter, size):
+    ''' Return the cached glyph for letter on a tile of the given size, or None if empty '''
+    if letter == "":
+        return None
+    return glyphs.atlas.render(letter, glyphs.tile_font_size(size))
+
+
+class AnimationCache:
+    def __init__(self):
+        self.clear()
+
+
+    def clear(self):
+        self.flips = {}
+        self.pops = {}
+
+
+    def flip_frames(self, letter, from_colour, to_colour, size, step=cfg.FLIP_STEP):
+        '''
+        Return the frames of a tile flipping over: it shrinks vertically to
+        nothing in from_colour, then grows back in to_colour, step pixels a
+        frame.
+        '''
+        key = (letter, from_colour, to_colour, size, step)
+        frames = self.flips.get(key)
+        if frames is None:
+            heights = flip_heights(size, step)
+            frames = FrameSheet(size, size, len(heights))
+            half = len(heights) // 2
+            for i, height in enumerate(heights):
+                if height == 0:
+                    continue
+                colour = from_colour if i < half else to_colour
+                area = frames.frame_area(i)
+                rect = pygame.Rect(area.x, area.y + (size - height) // 2, size, height)
+                sprites.draw_tile(frames.sheet, rect, colour, tile_glyph(letter, size),
+                                  letter_scale=height / size)
+            self.flips[key] = frames
+        return frames
+
+
+    def pop_frames(self, letter, colour, size):
+        ''' Return the frames of a tile briefly growing when a letter is entered '''
+        key = (letter, colour, size)
+        frames = self.pops.get(key)
+        if frames is None:
+            # Growth is in proportion to the tile, so smaller tiles (with
+            # smaller gaps) don't overlap their neighbours
+            growths = [growth * size // cfg.TILESIZE for growth in cfg.POP_GROWTH]
+            max_growth = max(growths)
+            frame_size = size + 2 * max_growth
+            frames = FrameSheet(frame_size, frame_size, len(growths),
+                                offset=(-max_growth, -max_growth))
+            for i, growth in enumerate(growths):
+                area = frames.frame_area(i)
+                rect = pygame.Rect(area.x + max_growth - growth, area.y + max_growth - growth,
+                                   size + 2 * growth, size + 2 * growth)
+                sprites.draw_tile(frames.sheet, rect, colour, tile_glyph(letter, size))
+            self.pops[key] = frames
+        return frames
+
+
+cache = AnimationCache()
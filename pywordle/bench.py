@@ -0,0 +1,246 @@
+'''
+Benchmarks for the game's hot paths: guess validation, scoring, word list
+loading, drawing a frame, playing whole games headlessly and the cold import
+time of the modules tooling uses. Results are written as JSON and compared
+against a stored baseline, so a slowdown in any of them is caught locally.
+The import time is also checked against a fixed budget (see config.py).
+
+    python -m pywordle bench                   # run and compare against the baseline
+    python -m pywordle bench --save-baseline   # run and store the results as the new baseline
+    python -m pywordle bench --only scoring validation
+'''
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from . import config as cfg
+from . import dictionary
+from . import engine
+
+
+def measure(func, repeat=5, min_time=0.2):
+    '''
+    Time func, which performs some number of operations and returns that
+    number. Each repeat calls func until min_time has passed, and the
+    fastest repeat is reported.
+    '''
+    best = None
+    for _ in range(repeat):
+        ops = 0
+        start = time.perf_counter()
+        while True:
+            ops += func()
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        rate = ops / elapsed
+        if best is None or rate > best:
+            best = rate
+    return {"ops_per_sec": best, "us_per_op": 1e6 / best}
+
+
+def sample_words(n, seed=0):
+    ''' Return a reproducible mix of valid and invalid guesses '''
+    rng = random.Random(seed)
+    valid = sorted(dictionary.get_dictionary().valid_set)
+    words = []
+    for _ in range(n):
+        if rng.random() < 0.8:
+            words.append(rng.choice(valid))
+        else:
+            words.append("".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(cfg.NUM_COLS)))
+    return words
+
+
+def bench_validation():
+    word_dictionary = dictionary.get_dictionary()
+    words = [word.upper() for word in sample_words(1000)]
+
+    def run():
+        for word in words:
+            word_dictionary.is_valid(word)
+        return len(words)
+    return measure(run)
+
+
+def bench_scoring():
+    rng = random.Random(1)
+    answers = dictionary.get_dictionary().answers
+    pairs = [(word.upper(), rng.choice(answers).upper()) for word in sample_words(1000)]
+
+    def run():
+        for guess, answer in pairs:
+            engine.score_guess(guess, answer)
+        return len(pairs)
+    return measure(run)
+
+
+def bench_scoring_table():
+    from . import feedback
+    table = feedback.get_feedback_table()
+    rng = random.Random(1)
+    pairs = [(rng.choice(table.guesses), rng.choice(table.answers)) for _ in range(1000)]
+
+    def run():
+        for guess, answer in pairs:
+            table.feedback(guess, answer)
+        return len(pairs)
+    return measure(run)
+
+
+def bench_load_word_lists():
+    def run():
+        dictionary.WordDictionary(dictionary.load_game_word_list(), dictionary.load_valid_word_list())
+        return 1
+    return measure(run)
+
+
+def bench_load_word_pack():
+    ''' Startup from the binary word pack (falls back to text if it hasn't been built) '''
+    def run():
+        dictionary.load_dictionary()
+        return 1
+    return measure(run)
+
+
+def _make_game():
+    # Draw to an off-screen dummy display
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from . import main
+    # Benchmark games are not saved to the stats database
+    game = main.Game(record_stats=False)
+    game.new()
+    game.draw()
+    return game
+
+
+def bench_draw_full():
+    game = _make_game()
+
+    def run():
+        game.full_redraw = True
+        game.draw()
+        return 1
+    return measure(run)
+
+
+def bench_draw_frame():
+    ''' A typical frame: one tile changes and an error message is fading '''
+    game = _make_game()
+    tile = game.tiles[0][0]
+    game.invalid_word = True
+
+    def run():
+        tile.letter = "A" if tile.letter != "A" else ""
+        tile.create_font()
+        game.timer = 0
+        game.draw()
+        return 1
+    return measure(run)
+
+
+def bench_headless_games():
+    def run():
+        return engine.simulate(20, seed=2)["games"]
+    return measure(run, repeat=3, min_time=1.0)
+
+
+def bench_import_time(repeat=5):
+    '''
+    Import the tooling modules in a fresh interpreter, timing only the
+    imports (not interpreter startup). The fastest run is reported
+    '''
+    code = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"import {', '.join(cfg.IMPORT_BUDGET_MODULES)}\n"
+            "print(time.perf_counter() - start, 'pygame' in sys.modules)")
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], cwd=cfg.ROOT_DIR, check=True,
+                                capture_output=True, text=True).stdout.split()
+        seconds, pygame_loaded = float(output[0]), output[1] == "True"
+        if best is None or seconds < best:
+            best = seconds
+    return {"ops_per_sec": 1 / best, "us_per_op": best * 1e6,
+            "budget_us": cfg.IMPORT_TIME_BUDGET * 1e6, "pygame_loaded": pygame_loaded}
+
+
+BENCHMARKS = {"validation": bench_validation,
+              "scoring": bench_scoring,
+              "scoring_table": bench_scoring_table,
+              "load_word_lists": bench_load_word_lists,
+              "load_word_pack": bench_load_word_pack,
+              "draw_full": bench_draw_full,
+              "draw_frame": bench_draw_frame,
+              "headless_games": bench_headless_games,
+              "import_time": bench_import_time}
+
+
+def compare(results, baseline, tolerance):
+    ''' Return a list of (name, current, baseline) for benchmarks that got slower '''
+    regressions = []
+    for name, result in results.items():
+        if name in baseline:
+            previous = baseline[name]["ops_per_sec"]
+            if result["ops_per_sec"] < previous * (1 - tolerance):
+                regressions.append((name, result["ops_per_sec"], previous))
+    return regressions
+
+
+def over_budget(results):
+    ''' Return a list of (name, reason) for benchmarks that broke a fixed budget '''
+    failures = []
+    for name, result in results.items():
+        if result.get("pygame_loaded"):
+            failures.append((name, "pygame was imported"))
+        if "budget_us" in result and result["us_per_op"] > result["budget_us"]:
+            failures.append((name, f"{result['us_per_op']:.0f} us (budget {result['budget_us']:.0f} us)"))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--output", help="write results JSON to this file as well as stdout")
+    parser.add_argument("--baseline", default=cfg.BENCH_BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="fractional slowdown allowed before a benchmark counts as a regression")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        results[name] = BENCHMARKS[name]()
+        print(f"{name:>16}: {results[name]['ops_per_sec']:14.1f} ops/s  "
+              f"{results[name]['us_per_op']:10.2f} us/op", file=sys.stderr)
+
+    report = {"results": results}
+    budget_failures = over_budget(results)
+    report["over_budget"] = [{"name": name, "reason": reason} for name, reason in budget_failures]
+    for name, reason in budget_failures:
+        print(f"OVER BUDGET {name}: {reason}", file=sys.stderr)
+    if args.save_baseline:
+        with open(args.baseline, "w") as a_file:
+            json.dump(results, a_file, indent=2)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r") as a_file:
+            baseline = json.load(a_file)
+        regressions = compare(results, baseline, args.tolerance)
+        report["regressions"] = [{"name": name, "ops_per_sec": current, "baseline_ops_per_sec": previous}
+                                 for name, current, previous in regressions]
+        for name, current, previous in regressions:
+            print(f"REGRESSION {name}: {current:.1f} ops/s (baseline {previous:.1f})", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as a_file:
+            a_file.write(output)
+    return 1 if report.get("regressions") or report["over_budget"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import datetime
+import os
+
+# COLOURS (R, G, B)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+DARKGREY = (40, 40, 40)
+LIGHTGREY = (100, 100, 100)
+K_LIGHTGREY = (180, 180, 180)
+GREEN = (0, 200, 0)
+BLUE = (0, 0, 255)
+RED = (255, 0, 0)
+YELLOW = (250, 200, 0)
+BGCOLOUR = DARKGREY
+
+# Game settings. Positions and sizes below are for a WIDTH x HEIGHT window
+# and are scaled to the real window size (see layout.py)
+WIDTH = 650
+HEIGHT = 900
+FPS = 60
+TITLE = "PyWordle"
+FONT_NAME = "Consolas"
+# Rendered messages kept for reuse. Letters are always kept (see glyphs.py)
+MESSAGE_CACHE_SIZE = 32
+
+# Coefficient for determining how long the error text is shown at full opacity
+ERROR_TEXT_FPS_DUR_COEF = 1.5
+# Coefficient for determining how long a hint is shown at full opacity
+HINT_TEXT_FPS_DUR_COEF = 3
+
+# In hard mode every guess must use all the hints revealed so far
+HARD_MODE = False
+
+# Show how many possible answers remain after each guess, between the board
+# and the keyboard
+SHOW_WORDS_LEFT = True
+WORDS_LEFT_Y = 640
+WORDS_LEFT_FONT_SIZE = 24
+
+TILESIZE = 70
+GAPSIZE = 10
+
+K_TILESIZE = 50
+K_GAPSIZE = 8
+
+# Word length and number of guesses of classic Wordle (see variants.py for others)
+NUM_COLS = 5
+NUM_ROWS = 6
+
+# Area the board(s) are laid out in: the height of the classic 6x5 board,
+# slightly above centre in y, with a margin at each side. Each variant's
+# tile size and margins are worked out from this (see variants.board_layout)
+BOARD_AREA_HEIGHT = NUM_ROWS * (TILESIZE + GAPSIZE)
+BOARD_AREA_TOP = int((HEIGHT - BOARD_AREA_HEIGHT) / 2) - 50
+BOARD_AREA_SIDE = 20
+# Space between boards in multi-board variants
+BOARD_GAP = 20
+
+# Keyboard tile layout x positions
+K_MARGIN_X = [int((WIDTH - (10 * (K_TILESIZE + K_GAPSIZE))) / 2),
+              int((WIDTH - (9 * (K_TILESIZE + K_GAPSIZE))) / 2),
+              int((WIDTH - (7 * (K_TILESIZE + K_GAPSIZE))) / 2)]
+
+# y position of top of QWERTY keyboard
+K_Y_OFFSET = 680
+
+# Parameters for row shaking animation
+ROW_MOVE_AMOUNT = 6
+ROW_MOVE_STEP = 3
+
+# Pixels a tile grows by on each side, per frame, when a letter is entered.
+# Must stay below GAPSIZE so a growing tile never overlaps its neighbours
+POP_GROWTH = (0, 2, 6, 6, 4, 0)
+
+# Pixels a tile's height changes by per frame while it flips over
+FLIP_STEP = 12
+# Seconds between the start of each tile's flip when a row is revealed
+FLIP_STAGGER = 0.2
+
+# Longest time step (in seconds) animations are advanced by in one frame
+MAX_FRAME_TIME = 0.1
+
+# Profiling (see profiler.py): number of frames in the rolling window, how
+# often the overlay text is refreshed (seconds) and its font size
+PROFILE_HISTORY = 240
+PROFILE_OVERLAY_INTERVAL = 0.25
+PROFILE_OVERLAY_FONT_SIZE = 18
+
+# Multi-game server settings (see server.py)
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+# Seconds before an idle session is dropped
+SERVER_SESSION_TIMEOUT = 30 * 60
+# Bytes of unsent responses allowed to queue before waiting on a client
+SERVER_WRITE_BUFFER = 64 * 1024
+
+# Top of the repository, which holds the data directory next to the package
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Word list locations, resolved relative to the package so tooling can be run
+# from any working directory
+DATA_DIR = os.path.join(ROOT_DIR, "data")
+GAME_WORD_LIST_PATH = os.path.join(DATA_DIR, "wordle_word_list.txt")
+VALID_WORD_LIST_PATH = os.path.join(DATA_DIR, "five_letter_words.txt")
+# Binary word pack compiled from both lists by wordpack.py
+WORD_PACK_PATH = os.path.join(DATA_DIR, "words.bin")
+
+# Generated files (feedback tables, solver caches) are written here
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+
+# Daily puzzle (see daily.py): the date of puzzle 0, the seed that shuffles
+# the answer schedule, and the number of days precomputed per cache file
+DAILY_EPOCH = datetime.date(2024, 1, 1)
+DAILY_SEED = "pywordle-daily"
+DAILY_BLOCK_DAYS = 64
+
+# Modules that tooling imports without the game, and the most time (in
+# seconds) importing them all may take in a fresh interpreter. Checked by
+# the bench command's import_time benchmark, which also fails if any of them
+# loads pygame
+IMPORT_BUDGET_MODULES = ("pywordle.__main__", "pywordle.engine", "pywordle.dictionary", "pywordle.variants",
+                         "pywordle.stats", "pywordle.replay")
+IMPORT_TIME_BUDGET = 0.1
+
+# Local benchmark results that bench.py compares new runs against
+BENCH_BASELINE_PATH = os.path.join(ROOT_DIR, "bench_baseline.json")
+
+# Player stats database (see stats.py), the default profile name, and the
+# most finished games the background writer saves in one transaction
+STATS_DB_PATH = os.path.join(DATA_DIR, "stats.db")
+DEFAULT_PLAYER = "player"
+STATS_BATCH_SIZE = 500
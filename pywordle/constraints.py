@@ -0,0 +1,137 @@
+'''
+Bitset index for filtering words by feedback. Each bitset is a Python int
+over the dictionary's sorted word list (bit i is dictionary.words[i]), with
+one bitset per (position, letter) and one per (letter, minimum count).
+Applying a guess's feedback to a set of candidates is then a handful of
+bitwise ANDs instead of a scan over every word.
+'''
+import collections
+from . import dictionary
+from . import engine
+
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+
+def indices_to_bitset(indices, n_bits):
+    ''' Return an int with the bits at the given indices set '''
+    bits = bytearray((n_bits + 7) // 8)
+    for i in indices:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+def bitset_to_indices(bitset):
+    ''' Return the indices of the set bits, in increasing order '''
+    indices = []
+    while bitset:
+        low = bitset & -bitset
+        indices.append(low.bit_length() - 1)
+        bitset ^= low
+    return indices
+
+
+def count_bits(bitset):
+    return bin(bitset).count("1")
+
+
+class ConstraintIndex:
+    def __init__(self, word_dictionary):
+        words = word_dictionary.words
+        self.words = words
+        self.word_length = len(words[0])
+        self.all_words = (1 << len(words)) - 1
+        index = {word: i for i, word in enumerate(words)}
+        self.answers = indices_to_bitset((index[word] for word in word_dictionary.answers), len(words))
+
+        # position[pos][letter]: words with letter at pos. A word pack already
+        # stores these, so map them rather than rebuilding them
+        pack = word_dictionary.pack
+        if pack is not None:
+            self.position = [{letter: pack.letter_bitset(pos, letter) for letter in ALPHABET}
+                             for pos in range(self.word_length)]
+        else:
+            at = [collections.defaultdict(list) for _ in range(self.word_length)]
+            for i, word in enumerate(words):
+                for pos, letter in enumerate(word):
+                    at[pos][letter].append(i)
+            self.position = [{letter: indices_to_bitset(at[pos][letter], len(words)) for letter in ALPHABET}
+                             for pos in range(self.word_length)]
+
+        # at_least[letter][n]: words containing letter at least n times
+        # (at_least[letter][0] is every word)
+        with_count = collections.defaultdict(list)
+        for i, word in enumerate(words):
+            for letter, count in collections.Counter(word).items():
+                for n in range(1, count + 1):
+                    with_count[letter, n].append(i)
+        self.at_least = {letter: [self.all_words] + [indices_to_bitset(with_count[letter, n], len(words))
+                                                     for n in range(1, self.word_length + 1)]
+                         for letter in ALPHABET}
+
+
+    def apply(self, candidates, guess, feedback):
+        '''
+        Return the candidates (a bitset) that would give this feedback for
+        guess: greens must match, other guessed letters must not be at that
+        position, and each letter's count must fit what the feedback shows.
+        '''
+        guess = guess.lower()
+        mask = candidates
+        # Number of copies of each letter the feedback confirms, and whether
+        # a grey copy shows there are no more than that
+        confirmed = collections.Counter()
+        capped = set()
+        for pos, (letter, state) in enumerate(zip(guess, feedback)):
+            if state == engine.CORRECT:
+                mask &= self.position[pos][letter]
+            else:
+                mask &= ~self.position[pos][letter]
+            if state == engine.ABSENT:
+                capped.add(letter)
+            else:
+                confirmed[letter] += 1
+
+        for letter, count in confirmed.items():
+            mask &= self.at_least[letter][count]
+        for letter in capped:
+            count = confirmed[letter]
+            if count < self.word_length:
+                mask &= ~self.at_least[letter][count + 1]
+        return mask
+
+
+    def hard_mode_words(self, greens, min_counts):
+        '''
+        Return the words (a bitset) hard mode allows as the next guess: every
+        green in greens (a letter or None per position) kept in place, and
+        at least min_counts[letter] copies of each revealed letter.
+        '''
+        mask = self.all_words
+        for pos, letter in enumerate(greens):
+            if letter is not None:
+                mask &= self.position[pos][letter.lower()]
+        for letter, count in min_counts.items():
+            mask &= self.at_least[letter.lower()][min(count, self.word_length)]
+        return mask
+
+
+    def count(self, candidates):
+        return count_bits(candidates)
+
+
+    def candidate_words(self, candidates):
+        return [self.words[i] for i in bitset_to_indices(candidates)]
+
+
+# Built indexes, keyed by the WordDictionary they cover
+_constraint_indexes = {}
+
+
+def get_constraint_index(word_dictionary=None):
+    ''' Return the process-wide ConstraintIndex for a dictionary (the classic one by default) '''
+    if word_dictionary is None:
+        word_dictionary = dictionary.get_dictionary()
+    if word_dictionary not in _constraint_indexes:
+        _constraint_indexes[word_dictionary] = ConstraintIndex(word_dictionary)
+    return _constraint_indexes[word_dictionary]
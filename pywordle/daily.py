@@ -0,0 +1,241 @@
+'''
+The daily puzzle: everyone playing on the same day gets the same secret
+word. Answers are taken from the game word list in a seeded, shuffled
+order, so the schedule is the same on every machine and no answer repeats
+until the whole list has been used. Then the list is shuffled again for the
+next pass.
+
+Puzzles are precomputed in blocks of cfg.DAILY_BLOCK_DAYS days and saved
+to cfg.CACHE_DIR. Each day has its answer, its row of the feedback table
+(the pattern every allowed guess gives against the answer, stored
+contiguously) and how the entropy solver does on it. Once a block is
+loaded, looking up one of its days is an index into arrays in memory, and
+each day's DailyPuzzle is made once.
+
+    python -m pywordle daily                    # today's puzzle and how the solver does
+    python -m pywordle daily --days 365         # precompute the next year of puzzles
+    python -m pywordle daily --date 2025-01-01 --answer
+'''
+import argparse
+import datetime
+import hashlib
+import os
+import random
+import sys
+import numpy as np
+from . import config as cfg
+from . import evaluate
+from . import feedback
+from . import solver
+
+
+class DailyPuzzle:
+    ''' One day's puzzle and its precomputed artifacts '''
+    __slots__ = ("number", "date", "answer", "patterns", "solver_guesses", "words_left", "table")
+
+    def __init__(self, number, date, answer, patterns, solver_guesses, words_left, table):
+        self.number = number
+        self.date = date
+        self.answer = answer
+        # Pattern of every allowed guess against the answer, by table row
+        self.patterns = patterns
+        # The entropy solver's guesses, and the answers left after each one
+        self.solver_guesses = solver_guesses
+        self.words_left = words_left
+        self.table = table
+
+
+    def feedback(self, guess):
+        ''' Return the feedback states for an allowed guess against the answer '''
+        return self.table.pattern_states[self.patterns[self.table.guess_index[guess.lower()]]]
+
+
+    def summary(self):
+        ''' Everything about the puzzle except the answer, for showing before it is solved '''
+        return {"day": self.number,
+                "date": self.date.isoformat(),
+                "solver_guesses": len(self.solver_guesses),
+                "solver_won": self.solver_guesses[-1] == self.answer,
+                "words_left": self.words_left}
+
+
+def answer_order(n_answers, seed, cycle):
+    ''' Return the answer columns in the order they are used in one pass (cycle) through the list '''
+    order = list(range(n_answers))
+    random.Random(f"{seed}:{cycle}").shuffle(order)
+    return order
+
+
+def solver_path(strategy, column, max_guesses):
+    '''
+    Play the answer in column with an evaluate.py strategy. Returns the
+    guess rows and the number of candidates left after each guess.
+    '''
+    table = strategy.table
+    candidates = np.arange(len(table.answers))
+    history = ()
+    rows = []
+    words_left = []
+    while len(rows) < max_guesses:
+        row = strategy.next_guess(history, candidates)
+        pattern = int(table.patterns[row, column])
+        candidates = candidates[table.patterns[row, candidates] == pattern]
+        rows.append(row)
+        words_left.append(len(candidates))
+        if table.guesses[row] == table.answers[column]:
+            break
+        history += (pattern,)
+    return rows, words_left
+
+
+class DailySchedule:
+    '''
+    The answer for every day, counted from cfg.DAILY_EPOCH (day 0), and
+    the precomputed puzzles. Blocks of days are loaded from the cache, or
+    built and saved, the first time one of their days is asked for.
+    '''
+    def __init__(self, table, seed=cfg.DAILY_SEED, epoch=cfg.DAILY_EPOCH, block_days=cfg.DAILY_BLOCK_DAYS,
+                 max_guesses=cfg.NUM_ROWS, cache_dir=cfg.CACHE_DIR):
+        self.table = table
+        self.seed = seed
+        self.epoch = epoch
+        self.block_days = block_days
+        self.max_guesses = max_guesses
+        self.cache_dir = cache_dir
+        # Names the cache files, so they are rebuilt if anything that
+        # changes the schedule or the word lists changes
+        key = f"{seed}|{epoch.isoformat()}|{block_days}|{max_guesses}|{table.digest}"
+        self.digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        # Answer order for each pass through the list, loaded blocks of
+        # arrays, and the puzzles made from them
+        self.orders = {}
+        self.blocks = {}
+        self.puzzles = {}
+        # The solver is only needed to build a block
+        self.strategy = None
+
+
+    def day_number(self, date=None):
+        ''' Return the puzzle number for a date (today by default) '''
+        if date is None:
+            date = datetime.date.today()
+        return (date - self.epoch).days
+
+
+    def column(self, day):
+        ''' Return the answer column for a day '''
+        cycle, i = divmod(day, len(self.table.answers))
+        order = self.orders.get(cycle)
+        if order is None:
+            order = self.orders[cycle] = answer_order(len(self.table.answers), self.seed, cycle)
+        return order[i]
+
+
+    def answer(self, day):
+        return self.table.answers[self.column(day)]
+
+
+    def block_path(self, block):
+        return os.path.join(self.cache_dir, f"daily_{self.digest}_{block}.npz")
+
+
+    def build_block(self, block):
+        ''' Compute the arrays for every day in a block '''
+        if self.strategy is None:
+            self.strategy = evaluate.EntropyStrategy(self.table, solver.get_opening_guess(self.table))
+        days = range(block * self.block_days, (block + 1) * self.block_days)
+        columns = np.array([self.column(day) for day in days], dtype=np.int32)
+        # Unused guesses are -1
+        solver_rows = np.full((len(days), self.max_guesses), -1, dtype=np.int32)
+        words_left = np.full((len(days), self.max_guesses), -1, dtype=np.int32)
+        for i, column in enumerate(columns):
+            rows, left = solver_path(self.strategy, int(column), self.max_guesses)
+            solver_rows[i, :len(rows)] = rows
+            words_left[i, :len(left)] = left
+        # Each day's patterns as one contiguous row, rather than a column
+        # strided across the whole table
+        patterns = np.ascontiguousarray(self.table.patterns[:, columns].T)
+        return {"columns": columns, "patterns": patterns, "solver_rows": solver_rows, "words_left": words_left}
+
+
+    def load_block(self, block):
+        ''' Return a block's arrays, building and caching them if needed '''
+        arrays = self.blocks.get(block)
+        if arrays is None:
+            path = self.block_path(block)
+            if os.path.exists(path):
+                with np.load(path) as data:
+                    arrays = {name: data[name] for name in data.files}
+            else:
+                arrays = self.build_block(block)
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Write to a temporary file first so other processes never see a partial block
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as a_file:
+                    np.savez(a_file, **arrays)
+                os.replace(tmp_path, path)
+            self.blocks[block] = arrays
+        return arrays
+
+
+    def precompute(self, first_day, days):
+        ''' Make sure every block covering days first_day onwards is built and loaded '''
+        for block in range(first_day // self.block_days, (first_day + days - 1) // self.block_days + 1):
+            self.load_block(block)
+
+
+    def puzzle(self, day):
+        ''' Return the DailyPuzzle for a day number '''
+        puzzle = self.puzzles.get(day)
+        if puzzle is None:
+            block, i = divmod(day, self.block_days)
+            arrays = self.load_block(block)
+            rows = [int(row) for row in arrays["solver_rows"][i] if row >= 0]
+            puzzle = DailyPuzzle(day, self.epoch + datetime.timedelta(days=day),
+                                 self.table.answers[arrays["columns"][i]], arrays["patterns"][i],
+                                 [self.table.guesses[row] for row in rows],
+                                 [int(n) for n in arrays["words_left"][i, :len(rows)]], self.table)
+            self.puzzles[day] = puzzle
+        return puzzle
+
+
+    def today(self):
+        return self.puzzle(self.day_number())
+
+
+# Schedules, keyed by the feedback table of their word lists
+_schedules = {}
+
+
+def get_schedule(word_dictionary=None):
+    ''' Return the process-wide DailySchedule for a dictionary (the classic one by default) '''
+    table = feedback.get_feedback_table(word_dictionary)
+    if table not in _schedules:
+        _schedules[table] = DailySchedule(table)
+    return _schedules[table]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show and precompute daily puzzles")
+    parser.add_argument("--date", type=datetime.date.fromisoformat, help="YYYY-MM-DD (default: today)")
+    parser.add_argument("--days", type=int, default=1, help="precompute this many days from the date")
+    parser.add_argument("--answer", action="store_true", help="show the answer and the solver's guesses")
+    args = parser.parse_args(argv)
+
+    schedule = get_schedule()
+    day = schedule.day_number(args.date)
+    schedule.precompute(day, args.days)
+    puzzle = schedule.puzzle(day)
+    summary = puzzle.summary()
+    result = f"{summary['solver_guesses']} guesses" if summary["solver_won"] else "no solution"
+    print(f"Puzzle #{puzzle.number} ({summary['date']}): solver {result}, "
+          f"words left after each guess {summary['words_left']}")
+    if args.answer:
+        print(f"Answer {puzzle.answer}, solver guesses {' '.join(puzzle.solver_guesses)}")
+    if args.days > 1:
+        print(f"Precomputed puzzles {day} to {day + args.days - 1} in {schedule.cache_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+import os
+from . import config as cfg
+from . import wordpack
+
+
+def load_game_word_list(path=cfg.GAME_WORD_LIST_PATH):
+    ''' Read the list of words that can be chosen as the secret word '''
+    with open(path, "r") as a_file:
+        return a_file.read().splitlines()
+
+
+def load_valid_word_list(path=cfg.VALID_WORD_LIST_PATH):
+    ''' Read the larger list of words the user is allowed to guess '''
+    with open(path, "r") as a_file:
+        return a_file.read().splitlines()
+
+
+class WordDictionary:
+    '''
+    Read-only word lists with hashed lookups. The lists are loaded once per
+    process for each variant (see get_dictionary) and shared by every Game
+    and every variant using the same lists, so validating a
+    guess is a set lookup rather than a scan over ~16,000 words. pack is the
+    memory-mapped wordpack.WordPack the lists came from, if any.
+    '''
+    def __init__(self, answers, valid_words, pack=None):
+        if pack is None:
+            # Keep the answer order so random.choice and indexing behave as before
+            self.answers = tuple(word.lower() for word in answers)
+            # Every answer must be guessable, even if it is missing from the
+            # larger list of valid words
+            self.valid_set = frozenset(word.lower() for word in valid_words) | frozenset(self.answers)
+            # All allowed guesses in sorted order. This is the record order of
+            # a word pack and the row order of the feedback table
+            self.words = tuple(sorted(self.valid_set))
+        else:
+            # A pack's words are already lower case, merged and sorted
+            self.answers = tuple(answers)
+            self.words = tuple(valid_words)
+            self.valid_set = frozenset(self.words)
+        self.answer_set = frozenset(self.answers)
+        self.pack = pack
+
+
+    def is_valid(self, word):
+        ''' Return True if word is an allowed guess '''
+        return word.lower() in self.valid_set
+
+
+    def is_answer(self, word):
+        ''' Return True if word can be chosen as the secret word '''
+        return word.lower() in self.answer_set
+
+
+    def __len__(self):
+        return len(self.valid_set)
+
+
+# Loaded dictionaries, keyed by their word list paths
+_dictionaries = {}
+
+
+def load_dictionary(pack_path=cfg.WORD_PACK_PATH, answer_path=cfg.GAME_WORD_LIST_PATH,
+                    valid_path=cfg.VALID_WORD_LIST_PATH):
+    '''
+    Load a WordDictionary from the binary word pack, or from the text files
+    if the pack is missing or stale
+    '''
+    pack = wordpack.load_pack(pack_path, answer_path, valid_path)
+    if pack is None:
+        missing = [path for path in (answer_path, valid_path) if not os.path.exists(path)]
+        if missing:
+            raise FileNotFoundError(f"Word list not found: {', '.join(missing)} (one word per line)")
+        return WordDictionary(load_game_word_list(answer_path), load_valid_word_list(valid_path))
+    words = pack.words()
+    answers = [words[i] for i in pack.answer_indices()]
+    return WordDictionary(answers, words, pack=pack)
+
+
+def get_dictionary(variant=None):
+    '''
+    Return the process-wide WordDictionary for a variants.Variant (classic
+    Wordle by default), loading it on first use
+    '''
+    if variant is None:
+        key = (cfg.WORD_PACK_PATH, cfg.GAME_WORD_LIST_PATH, cfg.VALID_WORD_LIST_PATH)
+    else:
+        key = (variant.pack_path, variant.answer_path, variant.valid_path)
+    if key not in _dictionaries:
+        _dictionaries[key] = load_dictionary(*key)
+    return _dictionaries[key]
@@ -0,0 +1,306 @@
+'''
+Pure-Python Wordle rules. Nothing in this module imports pygame, so games
+can be played by bots, load tests and tooling without opening a window.
+'''
+import random
+import time
+from . import config as cfg
+from . import dictionary
+
+
+# Feedback states for a single letter of a guess
+ABSENT = 0
+PRESENT = 1
+CORRECT = 2
+
+# Reasons a guess can be rejected by WordleEngine.validate
+NOT_ENOUGH_LETTERS = "not_enough_letters"
+INVALID_WORD = "invalid_word"
+# Hard mode: a revealed green is not kept in place, or a revealed letter is missing
+HARD_MODE_POSITION = "hard_mode_position"
+HARD_MODE_MISSING = "hard_mode_missing"
+
+
+def score_guess(guess, answer):
+    '''
+    Return a tuple of feedback states, one per letter of guess. Greens are
+    assigned first, then each remaining answer letter can make at most one
+    guess letter PRESENT, working left to right. This means a repeated letter
+    is only marked PRESENT as many times as it is unmatched in the answer.
+    '''
+    feedback = [ABSENT] * len(guess)
+    # Answer letters not already matched by a letter in the correct position
+    unmatched = {}
+    for i, (user_letter, true_letter) in enumerate(zip(guess, answer)):
+        if user_letter == true_letter:
+            feedback[i] = CORRECT
+        else:
+            unmatched[true_letter] = unmatched.get(true_letter, 0) + 1
+
+    for i, user_letter in enumerate(guess):
+        if feedback[i] != CORRECT and unmatched.get(user_letter, 0) > 0:
+            feedback[i] = PRESENT
+            unmatched[user_letter] -= 1
+    return tuple(feedback)
+
+
+class WordleEngine:
+    '''
+    Holds the state of a single game: the secret word, the guesses made so
+    far with their feedback, and the best state seen for each letter (used
+    to colour the keyboard). The server keeps one engine per session, so
+    instances use __slots__ to stay small.
+
+    In hard mode every guess must keep revealed greens in place and use
+    every revealed letter. The hints are folded into greens and
+    min_counts as each guess is scored, so checking a guess never replays
+    the history.
+    '''
+    __slots__ = ("dictionary", "word_list", "word_length", "max_guesses", "rng", "feedback_table", "hard_mode",
+                 "word", "guesses", "feedback", "keyboard", "greens", "min_counts", "won", "over")
+
+    def __init__(self, word_list=None, word_dictionary=None, word_length=cfg.NUM_COLS,
+                 max_guesses=cfg.NUM_ROWS, rng=None, feedback_table=None, hard_mode=False, word=None):
+        self.dictionary = word_dictionary if word_dictionary is not None else dictionary.get_dictionary()
+        self.word_list = word_list if word_list is not None else self.dictionary.answers
+        self.word_length = word_length
+        self.max_guesses = max_guesses
+        # Allows seeded, reproducible games
+        self.rng = rng if rng is not None else random
+        # Optional feedback.FeedbackTable, which turns scoring into a lookup
+        self.feedback_table = feedback_table
+        self.hard_mode = hard_mode
+        # The first game's secret word, or None to choose one
+        self.new(word)
+
+
+    def new(self, word=None):
+        ''' Reset for a new game, optionally with a given secret word '''
+        if word is None:
+            word = self.rng.choice(self.word_list)
+        self.word = word.upper()
+        self.guesses = []
+        self.feedback = []
+        # Maps letter -> best feedback state seen so far
+        self.keyboard = {}
+        # Revealed hints: the green letter at each position (or None), and
+        # the fewest copies of each letter the answer is known to contain
+        self.greens = [None] * self.word_length
+        self.min_counts = {}
+        self.won = False
+        self.over = False
+
+
+    @property
+    def current_row(self):
+        return len(self.guesses)
+
+
+    def validate(self, guess):
+        ''' Return None if guess can be submitted, or the reason it can't '''
+        if len(guess) != self.word_length:
+            return NOT_ENOUGH_LETTERS
+        if not self.dictionary.is_valid(guess):
+            return INVALID_WORD
+        if self.hard_mode:
+            violation = self.hard_mode_violation(guess)
+            if violation is not None:
+                return violation[0]
+        return None
+
+
+    def hard_mode_violation(self, guess):
+        '''
+        Return None if guess uses every revealed hint, otherwise a tuple of
+        (reason, position, letter) for the first rule it breaks. position is
+        None for HARD_MODE_MISSING.
+        '''
+        guess = guess.upper()
+        for i, letter in enumerate(self.greens):
+            if letter is not None and guess[i] != letter:
+                return HARD_MODE_POSITION, i, letter
+        for letter, count in self.min_counts.items():
+            if guess.count(letter) < count:
+                return HARD_MODE_MISSING, None, letter
+        return None
+
+
+    def submit(self, guess):
+        ''' Score a guess, record it and return its feedback '''
+        if self.over:
+            raise ValueError("The game is already over")
+        error = self.validate(guess)
+        if error is not None:
+            raise ValueError(f"Guess {guess!r} rejected: {error}")
+
+        guess = guess.upper()
+        if self.feedback_table is not None:
+            feedback = self.feedback_table.feedback(guess, self.word)
+        else:
+            feedback = score_guess(guess, self.word)
+        self.guesses.append(guess)
+        self.feedback.append(feedback)
+        # Fold this guess's hints into the hard mode state
+        found = {}
+        for i, (letter, state) in enumerate(zip(guess, feedback)):
+            self.keyboard[letter] = max(state, self.keyboard.get(letter, ABSENT))
+            if state == CORRECT:
+                self.greens[i] = letter
+            if state != ABSENT:
+                found[letter] = found.get(letter, 0) + 1
+        for letter, count in found.items():
+            if count > self.min_counts.get(letter, 0):
+                self.min_counts[letter] = count
+
+        # Check for termination conditions (correct guess or no more turns)
+        self.won = guess == self.word
+        self.over = self.won or self.current_row == self.max_guesses
+        return feedback
+
+
+    def is_consistent(self, word):
+        ''' Return True if word could be the answer given the feedback so far '''
+        word = word.upper()
+        return all(score_guess(guess, word) == feedback
+                   for guess, feedback in zip(self.guesses, self.feedback))
+
+
+class MultiBoardEngine:
+    '''
+    Several boards played at once with the same guesses, as in Dordle and
+    Quordle. Each board is a WordleEngine with its own secret word. A board
+    stops taking guesses once it is solved, and the game is won when every
+    board is solved. With a single board this behaves like WordleEngine,
+    except that submit returns a list of feedback.
+    '''
+    def __init__(self, boards=1, word_list=None, word_dictionary=None, word_length=cfg.NUM_COLS,
+                 max_guesses=cfg.NUM_ROWS, rng=None, hard_mode=False):
+        self.rng = rng if rng is not None else random
+        self.boards = [WordleEngine(word_list, word_dictionary, word_length, max_guesses, self.rng, hard_mode=hard_mode)
+                       for _ in range(boards)]
+        self.word_list = self.boards[0].word_list
+        self.word_length = word_length
+        self.max_guesses = max_guesses
+        self.hard_mode = hard_mode
+        self.new()
+
+
+    def new(self, words=None):
+        '''
+        Reset for a new game, optionally with the secret words (a sequence
+        with one per board, or a string of them separated by spaces)
+        '''
+        if words is None:
+            # Every board gets a different word
+            words = self.rng.sample(self.word_list, len(self.boards))
+        elif isinstance(words, str):
+            words = words.split()
+        for board, word in zip(self.boards, words):
+            board.new(word)
+        self.guesses = []
+        # Maps letter -> best feedback state seen on any board
+        self.keyboard = {}
+        self.won = False
+        self.over = False
+
+
+    @property
+    def words(self):
+        return [board.word for board in self.boards]
+
+
+    @property
+    def word(self):
+        ''' The secret words, separated by spaces '''
+        return " ".join(self.words)
+
+
+    @property
+    def current_row(self):
+        return len(self.guesses)
+
+
+    def active_boards(self):
+        ''' Indexes of the boards still taking guesses '''
+        return [i for i, board in enumerate(self.boards) if not board.over]
+
+
+    def validate(self, guess):
+        ''' Return None if guess can be submitted, or the reason it can't '''
+        for i in self.active_boards():
+            error = self.boards[i].validate(guess)
+            if error is not None:
+                return error
+        return None
+
+
+    def hard_mode_violation(self, guess):
+        for i in self.active_boards():
+            violation = self.boards[i].hard_mode_violation(guess)
+            if violation is not None:
+                return violation
+        return None
+
+
+    def submit(self, guess):
+        ''' Score a guess on every unsolved board. Returns a list with None for solved boards '''
+        if self.over:
+            raise ValueError("The game is already over")
+        error = self.validate(guess)
+        if error is not None:
+            raise ValueError(f"Guess {guess!r} rejected: {error}")
+
+        feedback = [board.submit(guess) if not board.over else None for board in self.boards]
+        self.guesses.append(guess.upper())
+        for board in self.boards:
+            for letter, state in board.keyboard.items():
+                self.keyboard[letter] = max(state, self.keyboard.get(letter, ABSENT))
+        self.won = all(board.won for board in self.boards)
+        self.over = self.won or self.current_row == self.max_guesses
+        return feedback
+
+
+class RandomStrategy:
+    '''
+    Guess a random answer word that is consistent with the feedback so far.
+    Candidates are filtered incrementally using only the latest feedback.
+    '''
+    def __init__(self):
+        self.candidates = []
+
+
+    def __call__(self, engine):
+        if engine.current_row == 0:
+            self.candidates = [word.upper() for word in engine.word_list]
+        else:
+            guess, feedback = engine.guesses[-1], engine.feedback[-1]
+            self.candidates = [word for word in self.candidates if score_guess(guess, word) == feedback]
+        return engine.rng.choice(self.candidates)
+
+
+def simulate(n_games, strategy=None, seed=None, **engine_kwargs):
+    '''
+    Play n_games back to back with no frame clock. strategy is called with
+    the engine and must return the next guess (a RandomStrategy is used if
+    none is given). Returns a dict of results, where guess_distribution[n]
+    counts games won in n guesses and guess_distribution[0] counts losses.
+    '''
+    if strategy is None:
+        strategy = RandomStrategy()
+    engine = WordleEngine(rng=random.Random(seed), **engine_kwargs)
+    distribution = [0] * (engine.max_guesses + 1)
+    start = time.perf_counter()
+    for _ in range(n_games):
+        engine.new()
+        while not engine.over:
+            engine.submit(strategy(engine))
+        distribution[engine.current_row if engine.won else 0] += 1
+    elapsed = time.perf_counter() - start
+
+    wins = n_games - distribution[0]
+    return {"games": n_games,
+            "wins": wins,
+            "guess_distribution": distribution,
+            "mean_guesses": (sum(n * count for n, count in enumerate(distribution)) / wins) if wins else None,
+            "elapsed": elapsed,
+            "games_per_second": (n_games / elapsed) if elapsed else None}
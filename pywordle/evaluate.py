@@ -0,0 +1,239 @@
+'''
+Offline strategy evaluation. Plays every answer in the game word list with
+a solver strategy, using the engine and the feedback table (no pygame), and
+reports the mean number of guesses, the fail rate and the distribution.
+
+    python -m pywordle evaluate entropy
+    python -m pywordle evaluate minimax --processes 8
+    python -m pywordle evaluate entropy --opener crane    # fixed opening guess
+
+Answers are split into chunks and played in a process pool. Each worker
+memory-maps the word pack and the feedback table, so the word data is
+shared rather than copied into every process. Finished chunks are appended
+to a checkpoint file, and an interrupted run picks up where it stopped.
+'''
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+import numpy as np
+from . import config as cfg
+from . import dictionary
+from . import engine
+from . import feedback
+from . import solver
+
+
+class Strategy:
+    '''
+    Chooses each guess (as a table row) from the candidates still left. A
+    strategy is deterministic, so every game that has seen the same
+    feedback gets the same guess. Guesses are memoised on the feedback so
+    far, and each node of the game tree is only computed once per process.
+    '''
+    def __init__(self, table, opener):
+        self.table = table
+        self.opener = table.guess_index[opener]
+        self.answer_rows = np.array([table.guess_index[word] for word in table.answers])
+        self.guesses = {}
+
+
+    def next_guess(self, history, candidates):
+        guess = self.guesses.get(history)
+        if guess is None:
+            if not history:
+                guess = self.opener
+            elif len(candidates) <= 2:
+                # Guessing a candidate can win outright and loses nothing
+                guess = int(self.answer_rows[candidates[0]])
+            else:
+                guess = self.choose(candidates)
+            self.guesses[history] = guess
+        return guess
+
+
+    def choose(self, candidates):
+        raise NotImplementedError
+
+
+class EntropyStrategy(Strategy):
+    ''' Guess the word with the most expected information, as the hint solver does '''
+    def choose(self, candidates):
+        scores = solver.entropies(self.table.patterns, candidates)
+        # Break ties in favour of words that could be the answer
+        scores[self.answer_rows[candidates]] += 1 / len(candidates)
+        return int(np.argmax(scores))
+
+
+class MinimaxStrategy(Strategy):
+    ''' Guess the word whose worst-case feedback leaves the fewest candidates '''
+    def choose(self, candidates):
+        # Doubling leaves room to prefer candidates when the worst cases tie
+        scores = solver.worst_case_sizes(self.table.patterns, candidates) * 2
+        scores[self.answer_rows[candidates]] -= 1
+        return int(np.argmin(scores))
+
+
+STRATEGIES = {"entropy": EntropyStrategy,
+              "minimax": MinimaxStrategy}
+
+
+def default_opener(name, table):
+    ''' The strategy's own choice of first guess, over every answer '''
+    if name == "entropy":
+        return solver.get_opening_guess(table)
+    strategy = STRATEGIES[name](table, table.guesses[0])
+    return table.guesses[strategy.choose(np.arange(len(table.answers)))]
+
+
+def play(game_engine, strategy, answer_column):
+    ''' Play one game and return the number of guesses taken, or 0 if it was lost '''
+    table = strategy.table
+    game_engine.new(table.answers[answer_column])
+    candidates = np.arange(len(table.answers))
+    history = ()
+    while not game_engine.over:
+        row = strategy.next_guess(history, candidates)
+        states = game_engine.submit(table.guesses[row])
+        pattern = feedback.encode(states)
+        candidates = candidates[table.patterns[row, candidates] == pattern]
+        history += (pattern,)
+    return game_engine.current_row if game_engine.won else 0
+
+
+# Set up once in each pool worker by _init_worker
+_worker_strategy = None
+_worker_engine = None
+
+
+def _init_worker(name, opener):
+    global _worker_strategy, _worker_engine
+    # Both of these are memory-mapped, so workers share the parent's pages
+    table = feedback.get_feedback_table()
+    _worker_strategy = STRATEGIES[name](table, opener)
+    _worker_engine = engine.WordleEngine(word_dictionary=dictionary.get_dictionary(), feedback_table=table)
+
+
+def _play_chunk(columns):
+    ''' Pool worker: play the answers in columns, returning their guess counts '''
+    return columns, [play(_worker_engine, _worker_strategy, column) for column in columns]
+
+
+def make_chunks(table, opener, chunk_size):
+    '''
+    Split the answer columns into chunks. Answers are grouped by the
+    feedback the opener gives them, so the games in a chunk mostly share a
+    subtree and a worker's memoised guesses are reused.
+    '''
+    opener_patterns = np.asarray(table.patterns[table.guess_index[opener]])
+    columns = [int(column) for column in np.argsort(opener_patterns, kind="stable")]
+    return [columns[i:i + chunk_size] for i in range(0, len(columns), chunk_size)]
+
+
+def read_checkpoint(path, header):
+    '''
+    Return {answer column: guesses} from a checkpoint file. The file starts
+    with a header line describing the run, and is ignored if the header
+    doesn't match this one.
+    '''
+    results = {}
+    if not os.path.exists(path):
+        return results
+    with open(path, "r") as a_file:
+        lines = a_file.read().splitlines()
+    if not lines or json.loads(lines[0]) != header:
+        return results
+    for line in lines[1:]:
+        try:
+            chunk = json.loads(line)
+        except ValueError:
+            # A partial line from a run that was killed mid-write
+            break
+        results.update(zip(chunk["columns"], chunk["guesses"]))
+    return results
+
+
+def summarise(results, max_guesses):
+    ''' Build the report dict, in the same shape as engine.simulate's results '''
+    distribution = [0] * (max_guesses + 1)
+    for guesses in results.values():
+        distribution[guesses] += 1
+    games = len(results)
+    wins = games - distribution[0]
+    return {"games": games,
+            "wins": wins,
+            "fail_rate": distribution[0] / games if games else None,
+            "guess_distribution": distribution,
+            "mean_guesses": (sum(n * count for n, count in enumerate(distribution)) / wins) if wins else None}
+
+
+def evaluate(name, opener=None, processes=None, chunk_size=16, checkpoint=None, fresh=False, log=sys.stderr):
+    ''' Play every answer with the named strategy and return the report dict '''
+    table = feedback.get_feedback_table()
+    if opener is None:
+        opener = default_opener(name, table)
+    opener = opener.lower()
+    if opener not in table.guess_index:
+        raise ValueError(f"{opener!r} is not an allowed guess")
+
+    header = {"strategy": name, "opener": opener, "table": table.digest, "max_guesses": cfg.NUM_ROWS}
+    if checkpoint is None:
+        checkpoint = os.path.join(cfg.CACHE_DIR, f"eval_{name}_{opener}_{table.digest}.jsonl")
+    results = {} if fresh else read_checkpoint(checkpoint, header)
+    if not results:
+        os.makedirs(os.path.dirname(os.path.abspath(checkpoint)), exist_ok=True)
+        with open(checkpoint, "w") as a_file:
+            a_file.write(json.dumps(header) + "\n")
+    elif log is not None:
+        print(f"Resuming from {checkpoint}: {len(results)} of {len(table.answers)} answers done", file=log)
+
+    chunks = [[column for column in chunk if column not in results]
+              for chunk in make_chunks(table, opener, chunk_size)]
+    chunks = [chunk for chunk in chunks if chunk]
+    start = time.perf_counter()
+    with open(checkpoint, "a") as a_file, \
+         concurrent.futures.ProcessPoolExecutor(processes, initializer=_init_worker,
+                                                initargs=(name, opener)) as executor:
+        futures = [executor.submit(_play_chunk, chunk) for chunk in chunks]
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            columns, guesses = future.result()
+            results.update(zip(columns, guesses))
+            # One line per chunk, flushed so a killed run loses at most the chunks in flight
+            a_file.write(json.dumps({"columns": columns, "guesses": guesses}) + "\n")
+            a_file.flush()
+            if log is not None and (done % 20 == 0 or done == len(futures)):
+                print(f"{len(results)}/{len(table.answers)} answers", file=log)
+    elapsed = time.perf_counter() - start
+
+    report = {"strategy": name, "opener": opener}
+    report.update(summarise(results, cfg.NUM_ROWS))
+    report["elapsed"] = elapsed
+    report["checkpoint"] = checkpoint
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a solver strategy by playing every answer")
+    parser.add_argument("strategy", choices=sorted(STRATEGIES))
+    parser.add_argument("--opener", help="fixed first guess (default: the strategy's own choice)")
+    parser.add_argument("--processes", type=int, help="worker processes (default: one per core)")
+    parser.add_argument("--chunk-size", type=int, default=16, help="answers per unit of work")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: in the cache directory)")
+    parser.add_argument("--fresh", action="store_true", help="ignore any existing checkpoint")
+    parser.add_argument("--output", help="write the report JSON to this file as well as stdout")
+    args = parser.parse_args(argv)
+
+    report = evaluate(args.strategy, args.opener, args.processes, args.chunk_size, args.checkpoint, args.fresh)
+    print(f"{report['strategy']} ({report['opener']}): mean {report['mean_guesses']:.4f} guesses, "
+          f"fail rate {report['fail_rate']:.2%}, distribution {report['guess_distribution']}", file=sys.stderr)
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as a_file:
+            a_file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+'''
+Precomputed feedback patterns for every (guess, answer) pair.
+
+A pattern packs the five feedback states of a guess into one number in base
+3, so there are 3^5 = 243 possible patterns and each fits in a uint8 (longer
+words from other variants need a uint16). The
+full table is built with vectorised NumPy operations, saved to a .npy file
+in cfg.CACHE_DIR and memory-mapped on later loads, so every process shares
+the same pages instead of rebuilding ~37MB of patterns.
+'''
+import hashlib
+import os
+import threading
+import numpy as np
+from . import config as cfg
+from . import dictionary
+from . import engine
+
+
+NUM_PATTERNS = 3 ** cfg.NUM_COLS
+
+
+def encode(states):
+    ''' Pack a sequence of feedback states into a pattern number '''
+    return sum(state * 3 ** i for i, state in enumerate(states))
+
+
+def decode(pattern, word_length=cfg.NUM_COLS):
+    ''' Unpack a pattern number into a tuple of feedback states '''
+    states = []
+    for _ in range(word_length):
+        pattern, state = divmod(pattern, 3)
+        states.append(state)
+    return tuple(states)
+
+
+# Decoding is needed for every scored guess, so do it once up front
+PATTERN_STATES = tuple(decode(pattern) for pattern in range(NUM_PATTERNS))
+
+
+def words_to_array(words):
+    ''' Convert words to an (n_words, word_length) array of letter codes 0-25 '''
+    joined = "".join(words).lower().encode("ascii")
+    letters = np.frombuffer(joined, dtype=np.uint8) - ord("a")
+    return letters.reshape(len(words), -1)
+
+
+def compute_patterns(guesses, answers, chunk_size=256):
+    '''
+    Return a (len(guesses), len(answers)) array of patterns. Greens are
+    found first; a non-green guess letter is then yellow if the number of
+    earlier non-green copies of it in the guess is less than the number of
+    non-green copies in the answer. This matches engine.score_guess.
+    '''
+    guess_letters = words_to_array(guesses)
+    answer_letters = words_to_array(answers)
+    word_length = guess_letters.shape[1]
+    dtype = np.uint8 if 3 ** word_length <= 256 else np.uint16
+    patterns = np.empty((len(guesses), len(answers)), dtype=dtype)
+
+    # Work on a block of guesses at a time to bound the size of the
+    # (chunk, n_answers, word_length) intermediates
+    for start in range(0, len(guesses), chunk_size):
+        block = guess_letters[start:start + chunk_size]
+        green = block[:, None, :] == answer_letters[None, :, :]
+        not_green = ~green
+        codes = np.zeros((len(block), len(answers)), dtype=dtype)
+        for i in range(word_length):
+            letter = block[:, i, None, None]
+            # Unmatched copies of this letter in the answer
+            available = ((answer_letters[None, :, :] == letter) & not_green).sum(axis=2)
+            # Earlier unmatched copies of this letter in the guess
+            same_earlier = block[:, None, :i] == letter
+            used = (same_earlier & not_green[:, :, :i]).sum(axis=2)
+            yellow = not_green[:, :, i] & (used < available)
+            codes += (green[:, :, i] * engine.CORRECT + yellow * engine.PRESENT).astype(dtype) * dtype(3 ** i)
+        patterns[start:start + chunk_size] = codes
+    return patterns
+
+
+def table_digest(guesses, answers):
+    ''' Short hash of both word lists, used to name (and invalidate) the cache file '''
+    digest = hashlib.sha1()
+    digest.update("\n".join(guesses).encode("ascii"))
+    digest.update(b"|")
+    digest.update("\n".join(answers).encode("ascii"))
+    return digest.hexdigest()[:12]
+
+
+class FeedbackTable:
+    '''
+    Pattern lookups for every allowed guess against every answer. Rows are
+    guesses (sorted), columns are answers (in word list order). path is the
+    cache file the patterns were mapped from, if any, so worker processes
+    can map the same file rather than receiving a copy.
+    '''
+    def __init__(self, guesses, answers, patterns, path=None):
+        self.guesses = tuple(guesses)
+        self.answers = tuple(answers)
+        self.guess_index = {word: i for i, word in enumerate(self.guesses)}
+        self.answer_index = {word: i for i, word in enumerate(self.answers)}
+        self.patterns = patterns
+        self.path = path
+        self.digest = table_digest(self.guesses, self.answers)
+        self.word_length = len(self.guesses[0])
+        self.num_patterns = 3 ** self.word_length
+        if self.word_length == cfg.NUM_COLS:
+            self.pattern_states = PATTERN_STATES
+        else:
+            self.pattern_states = tuple(decode(pattern, self.word_length) for pattern in range(self.num_patterns))
+
+
+    def pattern(self, guess, answer):
+        ''' Return the pattern number for guess against answer '''
+        return int(self.patterns[self.guess_index[guess.lower()], self.answer_index[answer.lower()]])
+
+
+    def feedback(self, guess, answer):
+        '''
+        Return the tuple of feedback states for guess against answer. Words
+        outside the table are scored directly.
+        '''
+        row = self.guess_index.get(guess.lower())
+        col = self.answer_index.get(answer.lower())
+        if row is None or col is None:
+            return engine.score_guess(guess.upper(), answer.upper())
+        return self.pattern_states[self.patterns[row, col]]
+
+
+def load_feedback_table(guesses, answers, cache_dir=cfg.CACHE_DIR):
+    '''
+    Memory-map the cached table for these word lists, building and saving
+    it first if it doesn't exist yet.
+    '''
+    path = os.path.join(cache_dir, f"feedback_{table_digest(guesses, answers)}.npy")
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        patterns = compute_patterns(guesses, answers)
+        # Write to a temporary file first so other processes never see a partial table
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as a_file:
+            np.save(a_file, patterns)
+        os.replace(tmp_path, path)
+    return FeedbackTable(guesses, answers, np.load(path, mmap_mode="r"), path=path)
+
+
+# Loaded tables, keyed by the WordDictionary they cover
+_feedback_tables = {}
+# The game loads a table on a background thread, so only one thread builds it
+_feedback_tables_lock = threading.Lock()
+
+
+def get_feedback_table(word_dictionary=None):
+    ''' Return the process-wide FeedbackTable for a dictionary (the classic one by default) '''
+    if word_dictionary is None:
+        word_dictionary = dictionary.get_dictionary()
+    with _feedback_tables_lock:
+        if word_dictionary not in _feedback_tables:
+            _feedback_tables[word_dictionary] = load_feedback_table(word_dictionary.words, word_dictionary.answers)
+    return _feedback_tables[word_dictionary]
@@ -0,0 +1,92 @@
+'''
+Process-wide cache of fonts and rendered text. Looking up a system font and
+rendering a glyph are both slow, and tiles re-create their letter whenever
+it changes, so every (font, size, text, colour) is only rendered once and
+the same Surface is shared by every tile that shows it. Whole messages are
+often one-offs (the secret word, the stats line), so only the most recently
+used cfg.MESSAGE_CACHE_SIZE of those are kept. Cached surfaces must be
+treated as read-only.
+'''
+import collections
+import string
+import pygame
+from . import config as cfg
+
+
+def tile_font_size(tile_size):
+    ''' Font size used for the letter on a tile of the given size '''
+    return int(60 * (tile_size / 100))
+
+
+class GlyphAtlas:
+    def __init__(self, message_cache_size=cfg.MESSAGE_CACHE_SIZE):
+        self.message_cache_size = message_cache_size
+        self.clear()
+
+
+    def clear(self):
+        ''' Drop every cached font, glyph and message, and reset the counters '''
+        self.fonts = {}
+        self.glyphs = {}
+        # Least recently used first
+        self.messages = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+    def get_font(self, size, font_name=cfg.FONT_NAME):
+        ''' Return the Font for (font_name, size), resolving it only once '''
+        font = self.fonts.get((font_name, size))
+        if font is None:
+            font = pygame.font.SysFont(font_name, size)
+            self.fonts[(font_name, size)] = font
+        return font
+
+
+    def render(self, text, size, colour=cfg.WHITE, font_name=cfg.FONT_NAME):
+        ''' Return (surface, (width, height)) for text, rendering it on a cache miss '''
+        key = (font_name, size, text, tuple(colour))
+        glyph = self.glyphs.get(key)
+        if glyph is None:
+            self.misses += 1
+            font = self.get_font(size, font_name)
+            glyph = (font.render(text, True, colour), font.size(text))
+            self.glyphs[key] = glyph
+        else:
+            self.hits += 1
+        return glyph
+
+
+    def render_message(self, text, size, colour=cfg.WHITE, font_name=cfg.FONT_NAME):
+        ''' Like render, for a message, keeping only the most recently used messages '''
+        key = (font_name, size, text, tuple(colour))
+        glyph = self.messages.get(key)
+        if glyph is None:
+            self.misses += 1
+            font = self.get_font(size, font_name)
+            glyph = (font.render(text, True, colour), font.size(text))
+            self.messages[key] = glyph
+            if len(self.messages) > self.message_cache_size:
+                self.messages.popitem(last=False)
+        else:
+            self.hits += 1
+            self.messages.move_to_end(key)
+        return glyph
+
+
+    def prewarm(self, tile_sizes, colour=cfg.WHITE, font_name=cfg.FONT_NAME):
+        ''' Render A-Z ahead of time for tiles of each of the given sizes '''
+        for tile_size in tile_sizes:
+            for letter in string.ascii_uppercase:
+                self.render(letter, tile_font_size(tile_size), colour, font_name)
+
+
+    def stats(self):
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "fonts": len(self.fonts),
+                "glyphs": len(self.glyphs),
+                "messages": len(self.messages)}
+
+
+atlas = GlyphAtlas()
@@ -0,0 +1,43 @@
+'''
+Maps the design coordinates in config.py, which describe a cfg.WIDTH x
+cfg.HEIGHT window, onto the real window, which can be any size. The game is
+laid out and rendered at the window's own resolution: positions, tile sizes
+and font sizes are scaled once when a Layout is made (at startup and on
+each resize), rather than drawing at the design size and scaling every
+frame. The design area keeps its proportions and is centred in the window.
+'''
+import pygame
+from . import config as cfg
+
+
+class Layout:
+    def __init__(self, window_size):
+        self.width, self.height = window_size
+        self.scale = min(self.width / cfg.WIDTH, self.height / cfg.HEIGHT)
+        # Space left at the sides (or top and bottom) of a window with
+        # different proportions to the design
+        self.offset_x = (self.width - round(cfg.WIDTH * self.scale)) // 2
+        self.offset_y = (self.height - round(cfg.HEIGHT * self.scale)) // 2
+        # Full redraws start from this, and areas are cleared from it
+        self.background = pygame.Surface(window_size)
+        self.background.fill(cfg.BGCOLOUR)
+
+
+    def size(self, value):
+        ''' Scale a length or font size, keeping it at least 1 pixel '''
+        return max(1, round(value * self.scale))
+
+
+    def x(self, value):
+        ''' Window x for a design x '''
+        return self.offset_x + round(value * self.scale)
+
+
+    def y(self, value):
+        ''' Window y for a design y '''
+        return self.offset_y + round(value * self.scale)
+
+
+    def centre_x(self, width):
+        ''' Window x that centres something width pixels wide '''
+        return int((self.width - width) / 2)
@@ -0,0 +1,125 @@
+'''
+Load test for server.py. Opens many client connections that each play
+games back to back for a fixed duration, then reports guesses per second,
+sessions per second, and how much server CPU time they cost (so results
+can be read per core). Optionally holds a number of idle sessions open to
+measure memory per session.
+
+Run the server first (python -m pywordle serve), then: python -m pywordle loadtest --clients 200
+'''
+import argparse
+import asyncio
+import collections
+import json
+import random
+import time
+from . import config as cfg
+from . import dictionary
+from . import engine
+
+
+async def request(reader, writer, message):
+    writer.write(json.dumps(message).encode() + b"\n")
+    return json.loads(await reader.readline())
+
+
+def hard_mode_words(words, guess, feedback):
+    ''' Return the words that keep the hints from a guess's feedback in place, as hard mode requires '''
+    greens = [(i, letter) for i, (letter, state) in enumerate(zip(guess, feedback)) if state == engine.CORRECT]
+    found = collections.Counter(letter for letter, state in zip(guess, feedback) if state != engine.ABSENT)
+    return [word for word in words
+            if all(word[i] == letter for i, letter in greens)
+            and all(word.count(letter) >= count for letter, count in found.items())]
+
+
+async def play_games(host, port, words, deadline, totals, rng):
+    '''
+    Play games until the deadline, guessing random answer words. In hard
+    mode the guesses are picked from the words that keep every hint so far,
+    so the server accepts them.
+    '''
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            response = await request(reader, writer, {"op": "new"})
+            session = response["session"]
+            hard_mode = response["hard"]
+            choices = words
+            while True:
+                word = rng.choice(choices)
+                response = await request(reader, writer, {"op": "guess", "session": session, "word": word})
+                # Only accepted guesses are counted as throughput
+                if not response["ok"]:
+                    totals["rejected"] += 1
+                    continue
+                totals["guesses"] += 1
+                if response["over"]:
+                    break
+                if hard_mode:
+                    choices = hard_mode_words(choices, word, response["feedback"])
+            await request(reader, writer, {"op": "end", "session": session})
+            totals["sessions"] += 1
+    finally:
+        writer.close()
+
+
+async def hold_sessions(host, port, n_sessions):
+    ''' Open n_sessions and leave them idle (sessions outlive their connection) '''
+    reader, writer = await asyncio.open_connection(host, port)
+    for _ in range(n_sessions):
+        await request(reader, writer, {"op": "new"})
+    writer.close()
+
+
+async def run(args):
+    words = dictionary.get_dictionary().answers
+    rng = random.Random(args.seed)
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    before = await request(reader, writer, {"op": "stats"})
+
+    results = {}
+    if args.hold:
+        await hold_sessions(args.host, args.port, args.hold)
+        held = await request(reader, writer, {"op": "stats"})
+        results["held_sessions"] = args.hold
+        results["rss_kb_per_held_session"] = (held["max_rss_kb"] - before["max_rss_kb"]) / args.hold
+        before = held
+
+    totals = {"guesses": 0, "rejected": 0, "sessions": 0}
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(play_games(args.host, args.port, words, deadline, totals, rng)
+                           for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    after = await request(reader, writer, {"op": "stats"})
+    writer.close()
+
+    cpu_seconds = after["cpu_seconds"] - before["cpu_seconds"]
+    results.update({"clients": args.clients,
+                    "elapsed": elapsed,
+                    "guesses": totals["guesses"],
+                    "rejected_guesses": totals["rejected"],
+                    "sessions": totals["sessions"],
+                    "guesses_per_second": totals["guesses"] / elapsed,
+                    "sessions_per_second": totals["sessions"] / elapsed,
+                    "server_cpu_seconds": cpu_seconds,
+                    # The server runs on one core, so this is the throughput per core
+                    "sessions_per_core_second": totals["sessions"] / cpu_seconds if cpu_seconds else None,
+                    "guesses_per_core_second": totals["guesses"] / cpu_seconds if cpu_seconds else None})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the Wordle server")
+    parser.add_argument("--host", default=cfg.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=cfg.SERVER_PORT)
+    parser.add_argument("--clients", type=int, default=100, help="concurrent connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run for")
+    parser.add_argument("--hold", type=int, default=0, help="idle sessions to open before the run")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
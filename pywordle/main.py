@@ -0,0 +1,902 @@
+import pygame
+import sys
+import time
+import random
+import threading
+import argparse
+from . import config as cfg
+from . import sprites
+from . import glyphs
+from . import animations
+from . import timeline
+from . import layout
+from . import dictionary
+from . import engine
+from . import variants
+from . import constraints
+from . import stats
+from . import replay
+
+
+# Tile colour for each engine feedback state
+FEEDBACK_COLOURS = {engine.ABSENT: cfg.LIGHTGREY,
+                    engine.PRESENT: cfg.YELLOW,
+                    engine.CORRECT: cfg.GREEN}
+
+# Key that shows the solver's suggested next guess
+HINT_KEY = pygame.K_TAB
+# Key that toggles the profiling overlay (only when profiling is enabled)
+PROFILE_KEY = pygame.K_F3
+
+# Letters on each row of the on-screen keyboard
+KEYBOARD_ROWS = ("QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM")
+
+# Methods timed individually when profiling is enabled
+PROFILED_METHODS = ("box_animation", "reveal_animation", "row_animation", "check_letters", "end_screen")
+
+
+def ordinal(n):
+    ''' 1 -> "1st", 2 -> "2nd", ... '''
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+class Game:
+    def __init__(self, profile=False, trace_path=None, hard_mode=cfg.HARD_MODE, player=cfg.DEFAULT_PLAYER,
+                 record_stats=True, seed=None, record_path=None, playback=None, variant=variants.CLASSIC.name,
+                 daily=False, window_size=(cfg.WIDTH, cfg.HEIGHT), fullscreen=False):
+        pygame.init()
+        # The window can be resized; everything is laid out for its size (see layout.py)
+        if fullscreen:
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            self.screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
+        pygame.display.set_caption(cfg.TITLE)
+        self.clock = pygame.time.Clock()
+        # Word length, number of guesses and boards, and where the boards go
+        # (in design coordinates)
+        self.variant = variants.get_variant(variant)
+        self.tilesize, self.gapsize, self.board_origins = variants.board_layout(self.variant)
+        if daily and self.variant.boards != 1:
+            raise ValueError("The daily puzzle is played on one board")
+        # When set, the next game is the day's shared puzzle (see daily.py)
+        self.daily = daily
+        self.layout = layout.Layout(self.screen.get_size())
+        # Render every letter for both tile sizes once, up front
+        self.prewarm_glyphs()
+        self.playing = False
+        self.not_enough_letters = False
+        self.invalid_word = False
+        self.hard_mode_error = False
+        # Word lists are loaded once per process and shared between games
+        self.dictionary = dictionary.get_dictionary(self.variant)
+        self.word_list = self.dictionary.answers
+        # A recording needs a seed so the secret words can be reproduced
+        if record_path is not None and seed is None:
+            seed = random.randrange(2 ** 63)
+        # All game rules live in the engine; this class only renders its state
+        self.engine = engine.MultiBoardEngine(self.variant.boards, word_list=self.word_list,
+                                              word_dictionary=self.dictionary, word_length=self.variant.word_length,
+                                              max_guesses=self.variant.max_guesses, rng=random.Random(seed),
+                                              hard_mode=hard_mode)
+        # The hint solver needs the feedback table, which can take seconds to
+        # build, so it is prepared on a background thread. Hints wait for it
+        self.solver = None
+        threading.Thread(target=self.prepare_solver, name="hint-solver", daemon=True).start()
+        # Bitsets for counting the answers that still fit the feedback
+        self.constraint_index = constraints.get_constraint_index(self.dictionary) if cfg.SHOW_WORDS_LEFT else None
+        # Finished games are saved in the background. The player's totals are
+        # read once here and kept up to date in memory for the end screen
+        self.player = player
+        self.stats = stats.StatsStore() if record_stats else None
+        self.player_summary = (self.stats.summary(player) if self.stats is not None
+                               else {"games": 0, "wins": 0, "current_streak": 0, "max_streak": 0})
+        # Key presses are either recorded to a replay file, or replaced by
+        # a recording being played back (a replay.Player)
+        self.recorder = replay.Recorder(record_path, seed, self.variant, hard_mode) if record_path is not None else None
+        self.replay = playback
+        # Running animations, advanced by Game.update each frame
+        self.timeline = timeline.Timeline()
+        # Profiling is off by default. When it is on, wrap the methods to be
+        # timed on this instance, so the normal code paths are unchanged
+        self.profiler = None
+        if profile or trace_path is not None:
+            from . import profiler
+            self.profiler = profiler.FrameProfiler(trace_path)
+            for name in PROFILED_METHODS:
+                setattr(self, name, self.profiler.timed(name, getattr(self, name)))
+            self.timeline.update = self.profiler.timed("timeline", self.timeline.update)
+    
+    
+    def new(self, words=None):
+        ''' Reset and prepare things for a new game, optionally with given secret words (one per board) '''
+        if words is None and self.replay is not None:
+            words = self.replay.start_game()
+            if words is None:
+                # The recording has finished
+                self.quit()
+        # The day's puzzle being played, if any. Later games are random again
+        self.puzzle = None
+        if words is None and self.daily:
+            from . import daily
+            self.puzzle = daily.get_schedule(self.dictionary).today()
+            words = [self.puzzle.answer]
+            self.daily = False
+        self.engine.new(words)
+        self.word = self.engine.word
+        if self.recorder is not None:
+            self.recorder.start_game(self.engine.words)
+        # Key presses are timed from here when recording or replaying
+        self.game_start = time.perf_counter()
+        self.text = ""
+        self.current_row = 0
+        self.create_tiles()
+        self.not_enough_letters = False
+        self.invalid_word = False
+        self.hard_mode_error = False
+        self.show_hint = False
+        self.hint_text = None
+        # Answers that fit every guess so far on each board, as constraints bitsets
+        self.candidates = ([self.constraint_index.answers] * self.variant.boards
+                           if self.constraint_index is not None else None)
+        self.words_left_text = None
+        self.words_left_rect = None
+        # Set when the first letter is typed, to time the game
+        self.start_time = None
+        # The game is over once the last guess is submitted, and the end
+        # screen is shown once its tiles have finished flipping
+        self.game_over = False
+        self.end_screen_shown = False
+        self.timeline.clear()
+        # Initialise and position all text elements
+        self.build_text_elements()
+        self.centre_text_elements()
+        if self.puzzle is not None:
+            self.show_below_board(f"Daily #{self.puzzle.number}")
+        # Timer for animations
+        self.timer = 0
+        # Everything is new, so the next frame must redraw the whole screen
+        self.full_redraw = True
+        
+        
+    def build_text_elements(self):
+        '''
+        Construct all of the text elements that may be required during a game,
+        and store them in a list. Their positions are hard-coded and could be
+        stored in config.py instead.
+        '''
+        # Invalid word messages
+        self.not_enough_letters_text = self.text_element(70, "Not Enough Letters")
+        self.invalid_word_text = self.text_element(70, "Invalid Word")
+        # Hard mode message. Its text is set to the rule that was broken
+        self.hard_mode_text = self.text_element(70, "Hard Mode")
+        # End screen messages (the failure message is made by missed_words_text)
+        self.end_screen_win_text = self.text_element(50, "You Guessed Right!")
+        # End screen play again message
+        self.play_again_text = self.text_element(100, "Press Enter to Play Again", font_size=30)
+        
+        # Create list of text elements so we can centre them all later
+        self.text_elements = [self.not_enough_letters_text,
+                              self.invalid_word_text,
+                              self.hard_mode_text,
+                              self.end_screen_win_text,
+                              self.play_again_text]
+    
+    
+    def centre_text_elements(self):
+        ''' Centre all the text elements the game contains '''
+        for el in self.text_elements:
+            text_surface_width = el.get_text_width()
+            # Calculate the new x position to centre the text
+            x = self.layout.centre_x(text_surface_width)
+            y = el.y
+            el.set_pos(x, y)
+    
+    
+    def text_element(self, y, text, font_size=40):
+        ''' Return a white text element at design y and font size, centred in the window '''
+        element = sprites.UIElement(0, self.layout.y(y), text, cfg.WHITE, self.layout.size(font_size))
+        element.set_pos(self.layout.centre_x(element.get_text_width()), element.y)
+        return element
+    
+    
+    def missed_words_text(self):
+        ''' Return the end screen message for a lost game, naming the words that weren't found '''
+        missed = [board.word for board in self.engine.boards if not board.won]
+        if len(missed) == 1:
+            return self.text_element(50, f"The Word Was {missed[0]}")
+        return self.text_element(50, f"The Words Were {' '.join(missed)}", font_size=30)
+    
+    
+    def prewarm_glyphs(self):
+        ''' Render every letter at the tile sizes for the current window '''
+        glyphs.atlas.prewarm((self.layout.size(self.tilesize), self.layout.size(cfg.K_TILESIZE)))
+    
+    
+    def board_tile_positions(self):
+        ''' Return (x, y, size) in the window of every input tile, as [board][row][column] '''
+        size = self.layout.size(self.tilesize)
+        step = self.layout.size(self.tilesize + self.gapsize)
+        return [[[(self.layout.x(margin_x) + col * step, self.layout.y(margin_y) + row * step, size)
+                  for col in range(self.variant.word_length)]
+                 for row in range(self.variant.max_guesses)]
+                for margin_x, margin_y in self.board_origins]
+    
+    
+    def keyboard_tile_positions(self):
+        ''' Return {letter: (x, y, size)} in the window for the keyboard tiles '''
+        size = self.layout.size(cfg.K_TILESIZE)
+        step = self.layout.size(cfg.K_TILESIZE + cfg.K_GAPSIZE)
+        return {letter: (self.layout.x(cfg.K_MARGIN_X[i]) + j * step, self.layout.y(cfg.K_Y_OFFSET) + i * step, size)
+                for i, row in enumerate(KEYBOARD_ROWS) for j, letter in enumerate(row)}
+    
+    
+    def create_tiles(self):
+        ''' Create tiles for user letters and the QWERTY keyboard representation '''
+        # Rows of tiles for user entry on each board, sized and placed for
+        # the variant and the window
+        self.boards = [[[sprites.Tile(x, y, size) for x, y, size in row] for row in board]
+                       for board in self.board_tile_positions()]
+        # The first (or only) board
+        self.tiles = self.boards[0]
+        # QWERTY keyboard tiles, by letter
+        self.keyboard_tiles = {letter: sprites.Tile(x, y, size, letter=letter, colour=cfg.K_LIGHTGREY)
+                               for letter, (x, y, size) in self.keyboard_tile_positions().items()}
+    
+    
+    def resize(self, window_size):
+        '''
+        Lay everything out again for a new window size. Tiles, text and
+        their cached renderings are all made at the new size here, once,
+        so drawing frames costs the same at any size.
+        '''
+        # pygame 2 resizes the display surface itself; older versions need set_mode
+        self.screen = pygame.display.get_surface()
+        if self.screen.get_size() != tuple(window_size):
+            self.screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
+        # Running animations were rendered for the old size, so skip to their ends
+        self.timeline.finish_all()
+        self.layout = layout.Layout(self.screen.get_size())
+        # Glyphs and animation frames are cached by size and the old sizes
+        # won't be drawn again
+        glyphs.atlas.clear()
+        animations.cache.clear()
+        self.prewarm_glyphs()
+        for board, positions in zip(self.boards, self.board_tile_positions()):
+            for row, row_positions in zip(board, positions):
+                for tile, (x, y, size) in zip(row, row_positions):
+                    tile.resize(x, y, size)
+        for letter, (x, y, size) in self.keyboard_tile_positions().items():
+            self.keyboard_tiles[letter].resize(x, y, size)
+        
+        # Text is rebuilt at the new size, keeping what it says and how far it has faded
+        old_elements = list(self.text_elements)
+        self.build_text_elements()
+        for element, old in zip(self.text_elements, old_elements):
+            element.set_text(old.text)
+            element.alpha = old.alpha
+        self.centre_text_elements()
+        if self.game_over:
+            old = self.end_screen_text
+            self.end_screen_text = self.end_screen_win_text if self.engine.won else self.missed_words_text()
+            self.end_screen_text.alpha = old.alpha
+            old = self.stats_text
+            self.stats_text = self.text_element(135, old.text, font_size=24)
+            self.stats_text.alpha = old.alpha
+        if self.hint_text is not None:
+            old = self.hint_text
+            self.hint_text = self.text_element(70, old.text)
+            self.hint_text.alpha = old.alpha
+        if self.words_left_text is not None:
+            self.show_below_board(self.words_left_text.text)
+        self.words_left_rect = None
+        self.full_redraw = True
+
+
+    def run(self):
+        if self.profiler is not None:
+            return self.run_profiled()
+        self.playing=True
+        while self.playing:
+            dt = self.wait_for_frame()
+            self.events()
+            self.update(dt)
+            self.draw()
+            
+    
+    def run_profiled(self):
+        ''' The same loop as run, with each phase of the frame timed '''
+        profiler = self.profiler
+        self.playing=True
+        while self.playing:
+            dt = self.wait_for_frame()
+            profiler.begin_frame()
+            profiler.measure("events", self.events)
+            profiler.measure("update", self.update, dt)
+            redraw = self.full_redraw
+            profiler.measure("draw", self.draw)
+            profiler.end_frame()
+            overlay_rect = profiler.draw_overlay(self.screen, force=redraw)
+            if overlay_rect is not None:
+                pygame.display.update(overlay_rect)
+            
+    
+    def wait_for_frame(self):
+        ''' Wait until the next frame is due and return the seconds since the last one '''
+        if self.is_idle():
+            # Nothing is animating or fading, so sleep until the next
+            # event arrives instead of ticking the frame loop
+            pygame.event.post(pygame.event.wait())
+            self.clock.tick()
+            return 0.0
+        # Seconds since the last frame, capped so a slow frame can't
+        # make animations jump
+        return min(self.clock.tick(cfg.FPS) / 1000, cfg.MAX_FRAME_TIME)
+            
+    
+    def is_idle(self):
+        ''' Return True if drawing another frame would not change the screen '''
+        if self.full_redraw or self.timeline.active:
+            return False
+        if self.replay is not None:
+            # Recorded key presses arrive on a timer, not as events
+            return False
+        if self.profiler is not None and self.profiler.overlay_visible:
+            # Keep the overlay's numbers moving
+            return False
+        if self.not_enough_letters or self.invalid_word or self.hard_mode_error or self.show_hint:
+            return False
+        if any(el.alpha > 0 for el in (self.not_enough_letters_text, self.invalid_word_text,
+                                       self.hard_mode_text, self.hint_text)
+               if el is not None):
+            # Still fading out
+            return False
+        if self.end_screen_shown and self.play_again_text.alpha < 255:
+            # Still fading in
+            return False
+        return not any(tile.dirty for tile in self.all_tiles())
+            
+    
+    def update(self, dt=0.0):
+        self.add_letter()
+        self.timeline.update(dt)
+
+
+    def current_rows(self):
+        ''' Return the current row of each board that is still being played '''
+        return [self.boards[i][self.current_row] for i in self.engine.active_boards()]
+
+
+    def add_letter(self):
+        # Show the letters that have been typed in the current row and clear
+        # the rest. Only tiles whose letter changes are touched, so unchanged
+        # tiles stay clean and are not redrawn.
+        for row in self.current_rows():
+            for i, tile in enumerate(row):
+                letter = self.text[i] if i < len(self.text) else ""
+                if tile.letter != letter:
+                    tile.letter = letter
+                    tile.create_font()
+
+
+    def draw_input_tiles(self):
+        for tiles in self.boards:
+            for row in tiles:
+                for tile in row:
+                    tile.draw(self.screen)
+                        
+
+    def draw_keyboard_tiles(self, surface=None):
+        if surface is None:
+            surface = self.screen
+        for tile in list(self.keyboard_tiles.values()):
+            tile.draw(surface)
+    
+    
+    def all_tiles(self):
+        ''' Iterate over the input tiles and the keyboard tiles '''
+        for tiles in self.boards:
+            for row in tiles:
+                yield from row
+        yield from self.keyboard_tiles.values()
+    
+    
+    def message_elements(self):
+        ''' Return the fading message text elements that may be on screen '''
+        elements = [self.not_enough_letters_text, self.invalid_word_text, self.hard_mode_text]
+        if self.hint_text is not None:
+            elements.append(self.hint_text)
+        if self.end_screen_shown:
+            elements += [self.end_screen_text, self.play_again_text, self.stats_text]
+        return elements
+
+
+    def draw(self):
+        # Check for invalid entries and update the error text fades
+        self.check_for_not_enough_letters()
+        self.check_for_invalid_word()
+        self.check_for_hard_mode_error()
+        self.check_for_hint()
+        if self.end_screen_shown:
+            self.end_screen_text.fade(fade_dir="in")
+            self.play_again_text.fade(fade_dir="in")
+            self.stats_text.fade(fade_dir="in")
+        
+        if self.full_redraw:
+            self.screen.blit(self.layout.background, (0, 0))
+            for el in self.message_elements():
+                el.draw(self.screen)
+            if self.words_left_text is not None:
+                self.words_left_text.draw(self.screen)
+                self.words_left_rect = self.words_left_text.rect
+            # Draw tiles and keyboard tiles
+            self.draw_input_tiles()
+            self.draw_keyboard_tiles()
+            pygame.display.flip()
+            self.full_redraw = False
+            return
+        
+        # Otherwise only redraw what has changed and push just those areas
+        dirty_rects = []
+        messages = self.message_elements()
+        if any(el.dirty for el in messages):
+            # Messages share the same area, so clear and redraw them together
+            area = messages[0].rect.unionall([el.rect for el in messages[1:]])
+            self.screen.blit(self.layout.background, area, area)
+            for el in messages:
+                el.draw(self.screen)
+            dirty_rects.append(area)
+        
+        if self.words_left_text is not None and self.words_left_text.dirty:
+            # Clear the previous count, which may have been wider
+            area = self.words_left_text.rect
+            if self.words_left_rect is not None:
+                area = area.union(self.words_left_rect)
+            self.screen.blit(self.layout.background, area, area)
+            self.words_left_text.draw(self.screen)
+            self.words_left_rect = self.words_left_text.rect
+            dirty_rects.append(area)
+        
+        for tile in self.all_tiles():
+            if tile.dirty:
+                # Clear wherever the tile was last drawn as well as where it is now
+                area = tile.rect.union(tile.drawn_rect)
+                self.screen.blit(self.layout.background, area, area)
+                tile.draw(self.screen)
+                # Animation frames can cover more than the tile itself
+                dirty_rects.append(area.union(tile.drawn_rect))
+        
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        
+        
+    def check_for_invalid_word(self):
+        '''
+        Check for invalid word entry and handle error text fade. This could
+        probably be refactored, along with check_for_not_enough_letters, to
+        adhere to DRY.
+        '''
+        if self.invalid_word:
+            self.timer += 1
+            self.invalid_word_text.fade(fade_dir="in")
+            if self.timer > (cfg.FPS * cfg.ERROR_TEXT_FPS_DUR_COEF):
+                self.invalid_word = False
+                self.timer = 0
+        else:
+            self.invalid_word_text.fade(fade_dir="out")
+    
+    
+    def check_for_not_enough_letters(self):
+        ''' Check length of entered word and handle error text fade '''
+        if self.not_enough_letters:
+            self.timer += 1
+            self.not_enough_letters_text.fade(fade_dir="in")
+            if self.timer > (cfg.FPS * cfg.ERROR_TEXT_FPS_DUR_COEF):
+                self.not_enough_letters = False
+                self.timer = 0
+        else:
+            self.not_enough_letters_text.fade(fade_dir="out")
+    
+    
+    def check_for_hard_mode_error(self):
+        ''' Handle the fade of the message shown when a guess breaks a hard mode rule '''
+        if self.hard_mode_error:
+            self.timer += 1
+            self.hard_mode_text.fade(fade_dir="in")
+            if self.timer > (cfg.FPS * cfg.ERROR_TEXT_FPS_DUR_COEF):
+                self.hard_mode_error = False
+                self.timer = 0
+        else:
+            self.hard_mode_text.fade(fade_dir="out")
+    
+    
+    def show_hard_mode_error(self):
+        ''' Set the hard mode message to the rule the current guess breaks '''
+        reason, position, letter = self.engine.hard_mode_violation(self.text)
+        if reason == engine.HARD_MODE_POSITION:
+            message = f"{ordinal(position + 1)} Letter Must Be {letter}"
+        else:
+            message = f"Guess Must Contain {letter}"
+        self.hard_mode_text.set_text(message)
+        self.hard_mode_text.set_pos(self.layout.centre_x(self.hard_mode_text.get_text_width()), self.hard_mode_text.y)
+        self.hard_mode_error = True
+    
+    
+    def check_for_hint(self):
+        ''' Handle the fade of the suggested word shown when a hint is requested '''
+        if self.hint_text is None:
+            return
+        if self.show_hint:
+            self.timer += 1
+            self.hint_text.fade(fade_dir="in")
+            if self.timer > (cfg.FPS * cfg.HINT_TEXT_FPS_DUR_COEF):
+                self.show_hint = False
+                self.timer = 0
+        else:
+            self.hint_text.fade(fade_dir="out")
+    
+    
+    def prepare_solver(self):
+        '''
+        Load (or build and cache) the feedback table and opening guess for
+        hints, then make the solver. Runs on a background thread so the
+        frame loop keeps going.
+        '''
+        # numpy and the solver are only imported here, off the main thread
+        from . import feedback
+        from . import solver
+        table = feedback.get_feedback_table(self.dictionary)
+        # In this process, not a pool: forking the game process isn't safe
+        solver.get_opening_guess(table, processes=1)
+        self.solver = solver.Solver(table)
+    
+    
+    def show_hint_suggestion(self):
+        ''' Ask the solver for the best next guess and show it as fading text '''
+        active = self.engine.active_boards()
+        if not active:
+            return
+        if self.solver is None:
+            # Still loading (see prepare_solver)
+            self.hint_text = self.text_element(70, "Hint Not Ready")
+        else:
+            # Suggest a guess for the first board that is still unsolved
+            self.solver.sync(self.engine.boards[active[0]])
+            suggestion = self.solver.best_guess(self.hard_mode_rows() if self.engine.hard_mode else None)
+            if suggestion is None:
+                return
+            self.hint_text = self.text_element(70, f"Try {suggestion.upper()}")
+        self.show_hint = True
+        self.timer = 0
+        # A previous hint may still be on screen where the new one won't cover it
+        self.full_redraw = True
+    
+    
+    def hard_mode_rows(self):
+        '''
+        Return the solver's guess rows that keep every hint on the unsolved
+        boards, for hard mode, or None if nothing has been revealed yet
+        (so the cached opening guess can be used)
+        '''
+        import numpy as np
+        boards = [self.engine.boards[i] for i in self.engine.active_boards()]
+        # Greens are counted in min_counts too
+        if not any(board.min_counts for board in boards):
+            return None
+        index = constraints.get_constraint_index(self.dictionary)
+        allowed = index.all_words
+        for board in boards:
+            allowed &= index.hard_mode_words(board.greens, board.min_counts)
+        # The feedback table's rows are the same sorted word list as the index
+        return np.array(constraints.bitset_to_indices(allowed), dtype=np.int64)
+    
+    
+    def play_frames(self, tile, frames, delay=0.0, on_complete=None):
+        ''' Schedule an animation frame sheet to play over a tile at cfg.FPS frames per second '''
+        letter = tile.letter
+        
+        def show_frame(progress):
+            # Stop showing frames if the letter has since been changed
+            if tile.letter == letter:
+                tile.set_frame(frames, min(int(progress * len(frames)), len(frames) - 1))
+        
+        def finish():
+            tile.clear_frames(frames)
+            if on_complete is not None:
+                on_complete()
+        
+        return self.timeline.add(len(frames) / cfg.FPS, show_frame, finish, delay)
+    
+    
+    def box_animation(self):
+        ''' Increase then decrease tile size when entering a letter in a tile '''
+        # The newest letter goes in the last tile with text once add_letter has run
+        self.add_letter()
+        for row in self.current_rows():
+            tile = row[len(self.text) - 1]
+            self.play_frames(tile, animations.cache.pop_frames(tile.letter, tile.colour, tile.width))
+                        
+        
+    def reveal_animation(self, tile, colour, delay=0.0, on_complete=None):
+        ''' When user checks a valid word, flip tiles and update colours '''
+        frames = animations.cache.flip_frames(tile.letter, tile.colour, colour, tile.width,
+                                              self.layout.size(cfg.FLIP_STEP))
+        
+        def reveal():
+            tile.colour = colour
+            if on_complete is not None:
+                on_complete()
+        
+        self.play_frames(tile, frames, delay, reveal)
+        
+        
+    def row_animation(self, on_complete=None):
+        ''' Animation to shake the row if user's entry is invalid '''
+        row = [tile for tiles in self.current_rows() for tile in tiles]
+        offsets = [round(offset * self.layout.scale) for offset in animations.shake_offsets()]
+        
+        def shake(progress):
+            offset = offsets[min(int(progress * len(offsets)), len(offsets) - 1)]
+            for tile in row:
+                tile.set_offset(offset)
+        
+        def finish():
+            for tile in row:
+                tile.set_offset(0)
+            if on_complete is not None:
+                on_complete()
+        
+        self.timeline.add(len(offsets) / cfg.FPS, shake, finish)
+    
+    
+    def check_letters(self):
+        '''
+        Score the entered word with the engine and flip the row's tiles one
+        after another to show the feedback. The keyboard is updated, and the
+        end screen shown if the game is over, once the last tile has flipped.
+        '''
+        active = self.engine.active_boards()
+        rows = self.current_rows()
+        feedback = self.engine.submit(self.text)
+        keyboard = dict(self.engine.keyboard)
+        # The next guess may be submitted while this row is still flipping,
+        # so the row's own result is kept for when it has been revealed
+        over = self.engine.over
+        won = self.engine.won
+        words_left = None
+        if self.candidates is not None:
+            for i in active:
+                self.candidates[i] = self.constraint_index.apply(self.candidates[i], self.text, feedback[i])
+            # Solved boards are shown as None
+            words_left = [None if board.won else self.constraint_index.count(candidates)
+                          for board, candidates in zip(self.engine.boards, self.candidates)]
+        
+        def revealed():
+            for letter, state in keyboard.items():
+                self.keyboard_tiles[letter].colour = FEEDBACK_COLOURS[state]
+            if self.puzzle is not None and over:
+                self.show_daily_result()
+            elif words_left is not None and not won:
+                self.show_words_left(words_left)
+            if over:
+                self.end_screen()
+        
+        # Every board flips at once, a column at a time
+        for board, row in zip(active, rows):
+            for i, (tile, state) in enumerate(zip(row, feedback[board])):
+                # Do the card flipping animation. Takes letter and colour
+                last = board == active[-1] and i == len(row) - 1
+                self.reveal_animation(tile, FEEDBACK_COLOURS[state], delay=i * cfg.FLIP_STAGGER,
+                                      on_complete=revealed if last else None)
+    
+    
+    def show_words_left(self, counts):
+        '''
+        Show the number of possible answers left on each board (None for a
+        solved board), centred below the boards
+        '''
+        if len(counts) == 1:
+            text = f"{counts[0]} word{'s' if counts[0] != 1 else ''} left"
+        else:
+            text = "  ".join("-" if count is None else str(count) for count in counts) + " words left"
+        self.show_below_board(text)
+    
+    
+    def show_daily_result(self):
+        ''' Compare the finished daily puzzle with the solver's precomputed game '''
+        summary = self.puzzle.summary()
+        solver_result = f"{summary['solver_guesses']}/{self.variant.max_guesses}" if summary["solver_won"] else "X"
+        player_result = f"{len(self.engine.guesses)}/{self.variant.max_guesses}" if self.engine.won else "X"
+        self.show_below_board(f"Daily #{self.puzzle.number}: you {player_result}, solver {solver_result}")
+    
+    
+    def show_below_board(self, text):
+        ''' Show a line of text centred between the boards and the keyboard '''
+        self.words_left_text = self.text_element(cfg.WORDS_LEFT_Y, text, font_size=cfg.WORDS_LEFT_FONT_SIZE)
+        self.words_left_text.alpha = 255
+    
+    
+    def clear_text(self):
+        self.text = ""
+            
+          
+    def events(self):
+        for event in self.poll_events():
+            self.handle_event(event)
+    
+    
+    def poll_events(self):
+        ''' Return this frame's events, recording or replaying key presses '''
+        events = pygame.event.get()
+        ms = (time.perf_counter() - self.game_start) * 1000
+        if self.replay is not None:
+            # Recorded key presses replace the real keyboard
+            events = [event for event in events if event.type != pygame.KEYDOWN]
+            events += self.replay.due_events(ms)
+        elif self.recorder is not None:
+            for event in events:
+                if event.type == pygame.KEYDOWN:
+                    self.recorder.key(ms, event.key, event.unicode)
+        return events
+    
+    
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.quit()
+        
+        if event.type == pygame.VIDEORESIZE:
+            self.resize(event.size)
+        
+        if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+            # The window was uncovered or restored and its contents may be
+            # lost. Only changes are drawn otherwise, so repaint everything
+            self.full_redraw = True
+            
+        if event.type == pygame.KEYDOWN and event.key == PROFILE_KEY:
+            if self.profiler is not None:
+                self.profiler.toggle_overlay()
+            
+        elif event.type == pygame.KEYDOWN and self.game_over:
+            # Wait for the end screen, then start a new game on Enter
+            if self.end_screen_shown and event.key == pygame.K_RETURN:
+                self.playing = False
+            
+        elif event.type == pygame.KEYDOWN:
+            # If the key is an alpha, add it to the word
+            if len(self.text) < self.variant.word_length and event.unicode.isalpha():
+                if self.start_time is None:
+                    self.start_time = time.perf_counter()
+                self.text += event.unicode.upper()
+                self.box_animation()
+                
+            # Delete last entered letter from current word/row
+            elif event.key == pygame.K_BACKSPACE:
+                self.text = self.text[:-1]
+            
+            # Show the solver's suggested next guess
+            elif event.key == HINT_KEY:
+                self.show_hint_suggestion()
+            
+            # Check entered word when return key is pressed
+            elif event.key == pygame.K_RETURN:
+                error = self.engine.validate(self.text)
+                # If we don't have enough letters entered, show a message
+                if error == engine.NOT_ENOUGH_LETTERS:
+                    # Row animation for not enough letters
+                    self.not_enough_letters = True
+                    self.row_animation()
+                    
+                # Check for invalid word entries
+                elif error == engine.INVALID_WORD:
+                    # Row animation for invalid word, then remove the invalid word
+                    self.invalid_word = True
+                    self.row_animation(on_complete=self.clear_text)
+                
+                # Hard mode: the guess ignores a revealed hint. Keep the
+                # text so it can be corrected
+                elif error in (engine.HARD_MODE_POSITION, engine.HARD_MODE_MISSING):
+                    self.show_hard_mode_error()
+                    self.row_animation()
+                    
+                else:
+                    # Check if letters are in words and assign colours
+                    self.check_letters()
+                    # Check for termination conditions (correct guess or player has no more turns)
+                    if self.engine.over:
+                        # Player loses - show failure message
+                        if not self.engine.won:
+                            self.end_screen_text = self.missed_words_text()
+                        # Player wins - show victory message
+                        else:
+                            self.end_screen_text = self.end_screen_win_text
+                        self.save_result()
+                        # The end screen is shown once the tiles have flipped
+                        self.game_over = True
+                        return
+                    
+                    # Termination conditions are not met. Continue to next row
+                    self.current_row += 1
+                    self.text = ""
+                    
+   
+    def save_result(self):
+        ''' Queue the finished game to be saved and update the player's totals '''
+        duration = time.perf_counter() - self.start_time if self.start_time is not None else 0.0
+        if self.stats is not None:
+            self.stats.record(stats.GameResult(self.player, self.word, self.engine.guesses, self.engine.won,
+                                               duration, self.engine.hard_mode))
+        if self.recorder is not None:
+            self.recorder.end_game(self.engine)
+        stats.apply_result(self.player_summary, self.engine.won)
+        summary = self.player_summary
+        win_rate = round(100 * summary["wins"] / summary["games"])
+        self.stats_text = self.text_element(135, f"Played {summary['games']}  Won {win_rate}%  "
+                                                 f"Streak {summary['current_streak']}  Max {summary['max_streak']}",
+                                            font_size=24)
+    
+    
+    def quit(self):
+        # Save any games still queued
+        if self.stats is not None:
+            self.stats.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.profiler is not None:
+            # Finish the trace file so it can be loaded
+            self.profiler.close()
+        pygame.quit()
+        sys.exit()
+        
+        
+    def end_screen(self):
+        '''
+        At the end of the game, fade in the result and wait for the user to
+        press Enter (handled in events)
+        '''
+        self.end_screen_shown = True
+                
+
+
+def window_size(text):
+    ''' Parse "WIDTHxHEIGHT" for --size '''
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} is not WIDTHxHEIGHT") from None
+    return width, height
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=cfg.TITLE)
+    parser.add_argument("--profile", action="store_true",
+                        help="time each frame; press F3 to show the overlay")
+    parser.add_argument("--trace", metavar="PATH", help="write a Chrome trace of every frame to PATH (implies --profile)")
+    parser.add_argument("--hard", action="store_true", default=cfg.HARD_MODE,
+                        help="every guess must use all the hints revealed so far")
+    parser.add_argument("--player", default=cfg.DEFAULT_PLAYER, help="profile to record games and stats under")
+    parser.add_argument("--seed", type=int, help="seed for choosing the secret words")
+    parser.add_argument("--record", metavar="PATH", help="record every game to a replay file (see replay.py)")
+    parser.add_argument("--variant", default=variants.CLASSIC.name, choices=sorted(variants.VARIANTS),
+                        help="word length and number of boards (see variants.py)")
+    parser.add_argument("--daily", action="store_true", help="start with today's shared puzzle (see daily.py)")
+    parser.add_argument("--size", type=window_size, default=(cfg.WIDTH, cfg.HEIGHT), metavar="WIDTHxHEIGHT",
+                        help=f"initial window size (default {cfg.WIDTH}x{cfg.HEIGHT}); the window can be resized")
+    parser.add_argument("--fullscreen", action="store_true", help="fill the screen at its native resolution")
+    args = parser.parse_args(argv)
+    if args.record is not None and args.seed is not None and args.seed not in replay.SEED_RANGE:
+        parser.error("--seed must be a signed 64-bit integer to be recorded")
+    error = variants.word_list_error(variants.get_variant(args.variant))
+    if error is not None:
+        parser.error(error)
+    if args.daily and variants.get_variant(args.variant).boards != 1:
+        parser.error("--daily needs a single-board variant")
+    game = Game(profile=args.profile, trace_path=args.trace, hard_mode=args.hard, player=args.player,
+                seed=args.seed, record_path=args.record, variant=args.variant, daily=args.daily,
+                window_size=args.size, fullscreen=args.fullscreen)
+    while True:
+        game.new()
+        game.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+'''
+Frame-time instrumentation. When enabled, Game.run times each phase of the
+frame (events, update, draw) and the animation methods, keeps a rolling
+window of frame times for an on-screen overlay (FPS, p50 and p99), and can
+stream every timed span to a Chrome trace file (open it in chrome://tracing
+or Perfetto). When profiling is off none of this code runs.
+'''
+import collections
+import json
+import os
+import time
+from . import config as cfg
+from . import glyphs
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    def __init__(self, trace_path=None, history=cfg.PROFILE_HISTORY):
+        # Seconds of work per frame, and seconds between frame starts
+        self.frame_times = collections.deque(maxlen=history)
+        self.frame_intervals = collections.deque(maxlen=history)
+        self.frame_start = None
+        self.overlay_visible = False
+        self.overlay_surface = None
+        self.overlay_rect = None
+        self.overlay_updated = 0.0
+        self.pid = os.getpid()
+        # Trace events are written as they happen, in Chrome's JSON array
+        # format, so memory use doesn't grow with the length of the session
+        self.trace_file = None
+        if trace_path is not None:
+            self.trace_file = open(trace_path, "w")
+            self.trace_file.write("[\n")
+            self.first_event = True
+
+
+    def record(self, name, start, end, category="frame"):
+        ''' Write a complete span to the trace file (times from time.perf_counter) '''
+        if self.trace_file is None:
+            return
+        event = {"name": name, "cat": category, "ph": "X", "pid": self.pid, "tid": 0,
+                 "ts": start * 1e6, "dur": (end - start) * 1e6}
+        if not self.first_event:
+            self.trace_file.write(",\n")
+        self.first_event = False
+        self.trace_file.write(json.dumps(event))
+
+
+    def measure(self, name, func, *args):
+        ''' Call func(*args), recording how long it took '''
+        start = time.perf_counter()
+        result = func(*args)
+        self.record(name, start, time.perf_counter())
+        return result
+
+
+    def timed(self, name, func, category="animation"):
+        ''' Return a wrapper around func that records every call '''
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.record(name, start, time.perf_counter(), category)
+            return result
+        return wrapper
+
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            self.frame_intervals.append(now - self.frame_start)
+        self.frame_start = now
+
+
+    def end_frame(self):
+        end = time.perf_counter()
+        self.frame_times.append(end - self.frame_start)
+        self.record("frame", self.frame_start, end)
+
+
+    def stats(self):
+        ''' Return FPS and p50/p99 frame times (in ms) over the rolling window '''
+        frame_times = sorted(self.frame_times)
+        mean_interval = sum(self.frame_intervals) / len(self.frame_intervals) if self.frame_intervals else 0.0
+        return {"fps": 1 / mean_interval if mean_interval else 0.0,
+                "p50_ms": percentile(frame_times, 0.5) * 1000,
+                "p99_ms": percentile(frame_times, 0.99) * 1000}
+
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+
+    def draw_overlay(self, screen, force=False):
+        '''
+        Draw (or clear) the overlay in the top-left corner and return the rect
+        that needs updating, or None. The text is only re-rendered a few
+        times a second, unless force is set (e.g. after the screen was cleared).
+        '''
+        if not self.overlay_visible:
+            if self.overlay_rect is None:
+                return None
+            # The overlay was just hidden, so clear it
+            rect, self.overlay_rect = self.overlay_rect, None
+            screen.fill(cfg.BGCOLOUR, rect)
+            return rect
+
+        now = time.perf_counter()
+        if not force and self.overlay_surface is not None and now - self.overlay_updated < cfg.PROFILE_OVERLAY_INTERVAL:
+            return None
+        self.overlay_updated = now
+        stats = self.stats()
+        text = f"FPS {stats['fps']:5.1f}  p50 {stats['p50_ms']:5.2f}ms  p99 {stats['p99_ms']:5.2f}ms"
+        # The text changes every time, so render it directly rather than filling the glyph cache
+        self.overlay_surface = glyphs.atlas.get_font(cfg.PROFILE_OVERLAY_FONT_SIZE).render(text, True, cfg.WHITE)
+        rect = self.overlay_surface.get_rect(topleft=(4, 4))
+        if self.overlay_rect is not None:
+            rect = rect.union(self.overlay_rect)
+        screen.fill(cfg.BGCOLOUR, rect)
+        self.overlay_rect = screen.blit(self.overlay_surface, (4, 4))
+        return rect
+
+
+    def close(self):
+        if self.trace_file is not None:
+            self.trace_file.write("\n]\n")
+            self.trace_file.close()
+            self.trace_file = None
@@ -0,0 +1,243 @@
+'''
+Recording and playback of games. A replay file holds the secret word of
+each game and every key press with its time since the game started, so a
+session can be reproduced exactly:
+
+    python -m pywordle play --record session.pwr    # play and record
+    python -m pywordle replay play session.pwr      # watch it again in real time
+    python -m pywordle replay run replays/*.pwr     # replay headless, as fast as possible
+
+Headless playback feeds the recorded keys straight into Game's key handling
+with no window drawing and no frame clock. Between key presses the animation
+timeline is stepped through the recorded gap, so anything that depends on
+an animation finishing happens at the same point as it did live. Each game's
+recorded guesses and result are compared with the replay's, so a set of
+replay files works as a regression corpus.
+
+File layout (little-endian):
+
+    header          magic, version, word length, max guesses, boards, hard mode,
+                    seed, variant name
+    b"G" words      a new game starts with these secret words, one per board
+    b"K" ms key ch  a key press: ms since the game started, pygame key code
+                    and the typed character (0 if none)
+    b"E" won n ...  the game finished: won flag, guess count, then the guesses
+'''
+import argparse
+import os
+import struct
+import sys
+import time
+from . import config as cfg
+from . import variants
+
+
+MAGIC = b"PYWR"
+VERSION = 2
+# magic, version, word length, max guesses, boards, hard mode flag, seed, variant name
+HEADER = struct.Struct("<4sBBBBBq16s")
+# Seeds a replay file can hold
+SEED_RANGE = range(-2 ** 63, 2 ** 63)
+# ms since the game started, pygame key code, typed character
+KEY = struct.Struct("<IIB")
+# won flag, number of guesses
+END = struct.Struct("<BB")
+
+
+class Recorder:
+    ''' Writes a replay file as games are played '''
+    def __init__(self, path, seed, variant=variants.CLASSIC, hard_mode=False):
+        self.a_file = open(path, "wb")
+        self.a_file.write(HEADER.pack(MAGIC, VERSION, variant.word_length, variant.max_guesses, variant.boards,
+                                      int(hard_mode), seed, variant.name.encode("ascii")))
+
+
+    def start_game(self, words):
+        self.a_file.write(b"G" + "".join(words).lower().encode("ascii"))
+
+
+    def key(self, ms, key, unicode):
+        char = ord(unicode) if len(unicode) == 1 and ord(unicode) < 256 else 0
+        self.a_file.write(b"K" + KEY.pack(int(ms), key, char))
+
+
+    def end_game(self, game_engine):
+        self.a_file.write(b"E" + END.pack(int(game_engine.won), len(game_engine.guesses)))
+        self.a_file.write("".join(game_engine.guesses).lower().encode("ascii"))
+        # Each finished game is complete on disk, even if the session crashes later
+        self.a_file.flush()
+
+
+    def close(self):
+        self.a_file.close()
+
+
+class RecordedGame:
+    __slots__ = ("words", "keys", "won", "guesses")
+
+    def __init__(self, words):
+        # One secret word per board
+        self.words = words
+        # (ms, key, char) tuples
+        self.keys = []
+        # Outcome, if the game was finished
+        self.won = None
+        self.guesses = None
+
+
+def read_replay(path):
+    ''' Return (header dict, list of RecordedGame) '''
+    with open(path, "rb") as a_file:
+        data = a_file.read()
+    if data[:4] != MAGIC or data[4:5] != bytes([VERSION]):
+        raise ValueError(f"{path} is not a version {VERSION} replay file")
+    _, _, word_length, max_guesses, boards, hard_mode, seed, variant = HEADER.unpack_from(data, 0)
+    header = {"word_length": word_length, "max_guesses": max_guesses, "boards": boards,
+              "hard_mode": bool(hard_mode), "seed": seed, "variant": variant.rstrip(b"\0").decode("ascii")}
+
+    games = []
+    offset = HEADER.size
+    while offset < len(data):
+        tag = data[offset:offset + 1]
+        offset += 1
+        if tag == b"G":
+            words = data[offset:offset + boards * word_length].decode("ascii")
+            games.append(RecordedGame([words[i:i + word_length] for i in range(0, len(words), word_length)]))
+            offset += boards * word_length
+        elif tag == b"K":
+            games[-1].keys.append(KEY.unpack_from(data, offset))
+            offset += KEY.size
+        elif tag == b"E":
+            won, n_guesses = END.unpack_from(data, offset)
+            offset += END.size
+            guesses = data[offset:offset + n_guesses * word_length].decode("ascii")
+            offset += n_guesses * word_length
+            games[-1].won = bool(won)
+            games[-1].guesses = [guesses[i:i + word_length] for i in range(0, len(guesses), word_length)]
+        else:
+            raise ValueError(f"{path}: bad record {tag!r} at byte {offset - 1}")
+    return header, games
+
+
+class Player:
+    '''
+    Feeds a recording to a Game running in real time: Game.new takes each
+    game's secret words from start_game, and Game.events takes the key presses that
+    are due from due_events.
+    '''
+    def __init__(self, games):
+        self.games = list(games)
+        self.game = None
+        self.next_key = 0
+
+
+    def start_game(self):
+        ''' Return the next recorded secret words, or None when there are none left '''
+        if not self.games:
+            return None
+        self.game = self.games.pop(0)
+        self.next_key = 0
+        return self.game.words
+
+
+    def due_events(self, ms):
+        ''' Return the key presses recorded up to ms into the game, as pygame events '''
+        import pygame
+        events = []
+        keys = self.game.keys if self.game is not None else ()
+        while self.next_key < len(keys) and keys[self.next_key][0] <= ms:
+            _, key, char = keys[self.next_key]
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=chr(char) if char else ""))
+            self.next_key += 1
+        return events
+
+
+def advance(game, seconds):
+    '''
+    Step the game's animations through seconds of game time, a frame at a
+    time, stopping early once nothing is animating
+    '''
+    while seconds > 0:
+        dt = min(seconds, 1 / cfg.FPS)
+        game.update(dt)
+        seconds -= dt
+        if not game.timeline.active:
+            break
+
+
+def make_headless_game(variant, hard_mode):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from . import main
+    return main.Game(hard_mode=hard_mode, record_stats=False, variant=variant)
+
+
+def run_headless(paths, log=sys.stderr):
+    '''
+    Replay every game in the given files without drawing. Returns a dict of
+    counts, and the games whose outcome differs from the recording.
+    '''
+    import pygame
+    games_by_mode = {}
+    results = {"files": len(paths), "games": 0, "keys": 0, "mismatches": []}
+    start = time.perf_counter()
+    for path in paths:
+        header, games = read_replay(path)
+        mode = (header["variant"], header["hard_mode"])
+        if mode not in games_by_mode:
+            games_by_mode[mode] = make_headless_game(*mode)
+        game = games_by_mode[mode]
+        for n, recorded in enumerate(games):
+            game.new(recorded.words)
+            previous = 0
+            for ms, key, char in recorded.keys:
+                advance(game, (ms - previous) / 1000)
+                previous = ms
+                game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=chr(char) if char else ""))
+            advance(game, cfg.MAX_FRAME_TIME)
+            results["games"] += 1
+            results["keys"] += len(recorded.keys)
+            if recorded.guesses is None:
+                # The player quit before finishing this game
+                continue
+            guesses = [guess.lower() for guess in game.engine.guesses]
+            if guesses != recorded.guesses or game.engine.won != recorded.won:
+                results["mismatches"].append({"file": path, "game": n, "words": recorded.words,
+                                              "recorded": recorded.guesses, "replayed": guesses})
+                if log is not None:
+                    print(f"MISMATCH {path} game {n} ({' '.join(recorded.words)}): recorded {recorded.guesses}, "
+                          f"replayed {guesses}", file=log)
+    results["elapsed"] = time.perf_counter() - start
+    return results
+
+
+def play(path):
+    ''' Watch a recording in a window, in real time '''
+    from . import main
+    header, games = read_replay(path)
+    game = main.Game(hard_mode=header["hard_mode"], record_stats=False, playback=Player(games),
+                     variant=header["variant"])
+    while True:
+        game.new()
+        game.run()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play back recorded games")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    play_parser = subparsers.add_parser("play", help="watch a recording in real time")
+    play_parser.add_argument("path")
+    run_parser = subparsers.add_parser("run", help="replay recordings headless and check their outcomes")
+    run_parser.add_argument("paths", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "play":
+        play(args.path)
+        return 0
+    results = run_headless(args.paths)
+    print(f"Replayed {results['games']} games ({results['keys']} keys) from {results['files']} files "
+          f"in {results['elapsed']:.2f}s, {len(results['mismatches'])} mismatches", file=sys.stderr)
+    return 1 if results["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+'''
+Multi-game server. Hosts many independent Wordle sessions in one process,
+speaking a line-based JSON protocol over TCP. Each request is one JSON
+object per line and gets exactly one JSON object back:
+
+    {"op": "new"}                                  -> {"ok": true, "session": 1, ...}
+    {"op": "new", "seed": 7}                       (reproducible secret word)
+    {"op": "new", "hard": true}                    (hard mode for this session)
+    {"op": "new", "daily": true}                   (today's shared puzzle; see daily.py)
+    {"op": "daily"}                                -> {"ok": true, "day": 1021, "solver_guesses": 4, ...}
+    {"op": "guess", "session": 1, "word": "crane"} -> {"ok": true, "feedback": [0, 2, 0, 1, 0], ...}
+    {"op": "end", "session": 1}                    -> {"ok": true}
+    {"op": "stats"}                                -> {"ok": true, "sessions": ..., ...}
+
+Errors are reported as {"ok": false, "error": "<reason>"}, where the reason
+is one of the engine's rejection reasons or a protocol error.
+
+Run with: python -m pywordle serve --port 8765
+Add --hard to play every session in hard mode (e.g. for tournament rooms).
+Today's daily puzzle is loaded (or precomputed) on startup, and the next
+block of days is precomputed in the background, so daily requests are
+always a lookup.
+'''
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import resource
+import time
+from . import config as cfg
+from . import dictionary
+from . import engine
+
+
+def is_integer(value):
+    ''' Return True for a JSON integer. true and false decode to bools, which are also ints '''
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class Session:
+    ''' One player's game. Sessions are numerous, so keep them small '''
+    __slots__ = ("engine", "last_active", "puzzle")
+
+    def __init__(self, game_engine, puzzle=None):
+        self.engine = game_engine
+        self.last_active = time.monotonic()
+        # The DailyPuzzle being played, if any
+        self.puzzle = puzzle
+
+
+class WordleServer:
+    def __init__(self, session_timeout=cfg.SERVER_SESSION_TIMEOUT, hard_mode=False):
+        # Every session shares the same read-only word lists
+        self.dictionary = dictionary.get_dictionary()
+        self.sessions = {}
+        self.next_session_id = 1
+        self.session_timeout = session_timeout
+        # Force hard mode for every session, whatever the client asks for
+        self.hard_mode = hard_mode
+        # Counters reported by the "stats" op
+        self.games_started = 0
+        self.guesses = 0
+        self.connections = 0
+        # Daily puzzle schedule, loaded on first use (see daily_puzzle)
+        self.schedule = None
+
+
+    def daily_puzzle(self):
+        ''' Return today's DailyPuzzle '''
+        if self.schedule is None:
+            from . import daily
+            self.schedule = daily.get_schedule(self.dictionary)
+        return self.schedule.today()
+
+
+    def new_session(self, seed=None, hard_mode=False, daily=False):
+        puzzle = self.daily_puzzle() if daily else None
+        if puzzle is not None:
+            word = puzzle.answer
+        else:
+            word = random.Random(seed).choice(self.dictionary.answers) if seed is not None else None
+        game_engine = engine.WordleEngine(word_dictionary=self.dictionary, hard_mode=hard_mode or self.hard_mode,
+                                          word=word)
+        session_id = self.next_session_id
+        self.next_session_id += 1
+        self.sessions[session_id] = Session(game_engine, puzzle)
+        self.games_started += 1
+        return session_id
+
+
+    def handle_request(self, request):
+        ''' Return the response dict for one decoded request '''
+        op = request.get("op")
+        if op == "new":
+            seed = request.get("seed")
+            if seed is not None and not is_integer(seed):
+                return {"ok": False, "error": "bad_seed"}
+            hard_mode = request.get("hard", False)
+            if not isinstance(hard_mode, bool):
+                return {"ok": False, "error": "bad_hard"}
+            daily = request.get("daily", False)
+            if not isinstance(daily, bool):
+                return {"ok": False, "error": "bad_daily"}
+            session_id = self.new_session(seed, hard_mode, daily)
+            session = self.sessions[session_id]
+            response = {"ok": True, "session": session_id, "word_length": session.engine.word_length,
+                        "max_guesses": session.engine.max_guesses, "hard": session.engine.hard_mode}
+            if session.puzzle is not None:
+                response["day"] = session.puzzle.number
+            return response
+        if op == "daily":
+            response = {"ok": True}
+            response.update(self.daily_puzzle().summary())
+            return response
+        if op == "stats":
+            return self.stats()
+
+        session_id = request.get("session")
+        session = self.sessions.get(session_id) if is_integer(session_id) else None
+        if session is None:
+            return {"ok": False, "error": "unknown_session"}
+        session.last_active = time.monotonic()
+
+        if op == "guess":
+            game_engine = session.engine
+            word = request.get("word")
+            if not isinstance(word, str):
+                return {"ok": False, "error": "missing_word"}
+            if game_engine.over:
+                return {"ok": False, "error": "game_over"}
+            error = game_engine.validate(word)
+            if error is not None:
+                return {"ok": False, "error": error}
+            feedback = game_engine.submit(word)
+            self.guesses += 1
+            response = {"ok": True, "feedback": feedback, "won": game_engine.won, "over": game_engine.over}
+            if game_engine.over:
+                response["answer"] = game_engine.word.lower()
+                if session.puzzle is not None:
+                    response["solver_path"] = session.puzzle.solver_guesses
+            return response
+        if op == "end":
+            del self.sessions[session_id]
+            return {"ok": True}
+        return {"ok": False, "error": "unknown_op"}
+
+
+    def stats(self):
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {"ok": True,
+                "sessions": len(self.sessions),
+                "games_started": self.games_started,
+                "guesses": self.guesses,
+                "connections": self.connections,
+                "cpu_seconds": usage.ru_utime + usage.ru_stime,
+                "max_rss_kb": usage.ru_maxrss}
+
+
+    async def handle_client(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    response = self.handle_request(request) if isinstance(request, dict) \
+                        else {"ok": False, "error": "bad_request"}
+                except ValueError:
+                    response = {"ok": False, "error": "bad_json"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                # Only wait for the socket when its buffer is filling up
+                if writer.transport.get_write_buffer_size() > cfg.SERVER_WRITE_BUFFER:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+
+    async def expire_sessions(self):
+        ''' Periodically drop sessions that have been idle too long '''
+        while True:
+            await asyncio.sleep(self.session_timeout / 4)
+            cutoff = time.monotonic() - self.session_timeout
+            for session_id in [sid for sid, session in self.sessions.items() if session.last_active < cutoff]:
+                del self.sessions[session_id]
+
+
+    async def prepare_daily_puzzles(self):
+        '''
+        Keep the daily puzzles for today's block of days and the next block
+        loaded, checking again after each midnight. Blocks are built in a
+        worker thread, so the day a new block starts never stalls requests.
+        '''
+        loop = asyncio.get_running_loop()
+        while True:
+            await loop.run_in_executor(None, self.schedule.precompute, self.schedule.day_number(),
+                                       self.schedule.block_days + 1)
+            tomorrow = datetime.datetime.combine(datetime.date.today() + datetime.timedelta(days=1), datetime.time())
+            await asyncio.sleep((tomorrow - datetime.datetime.now()).total_seconds() + 1)
+
+
+    async def serve(self, host, port):
+        # Load today's puzzle before taking connections, so no request waits for it
+        self.daily_puzzle()
+        server = await asyncio.start_server(self.handle_client, host, port)
+        background = [asyncio.create_task(self.expire_sessions()),
+                      asyncio.create_task(self.prepare_daily_puzzles())]
+        print(f"Serving Wordle on {host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in background:
+                task.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host many Wordle sessions over a line-based JSON protocol")
+    parser.add_argument("--host", default=cfg.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=cfg.SERVER_PORT)
+    parser.add_argument("--session-timeout", type=float, default=cfg.SERVER_SESSION_TIMEOUT,
+                        help="seconds before an idle session is dropped")
+    parser.add_argument("--hard", action="store_true", help="play every session in hard mode")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(WordleServer(args.session_timeout, args.hard).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
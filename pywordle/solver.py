@@ -0,0 +1,252 @@
+'''
+Entropy-based solver. Each guess is scored by the expected information it
+gives about the remaining candidate answers, using the precomputed feedback
+table so a whole turn is a few NumPy operations rather than a Python loop
+over every (guess, answer) pair.
+
+    python -m pywordle solve                        # best opening guess
+    python -m pywordle solve crane:..y.g slate:g.y..
+
+Each guess is given with its feedback: g for green, y for yellow and . for
+grey.
+'''
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import numpy as np
+from . import config as cfg
+from . import feedback
+from . import engine
+
+
+def pattern_counts(patterns, rows, candidates, num_patterns=feedback.NUM_PATTERNS):
+    '''
+    Return a (len(rows), num_patterns) array counting how many candidates
+    produce each pattern for each guess row. All rows are counted with a
+    single bincount by offsetting each row's patterns into its own block.
+    '''
+    block = np.asarray(patterns[rows][:, candidates], dtype=np.int64)
+    block += (np.arange(len(rows), dtype=np.int64) * num_patterns)[:, None]
+    counts = np.bincount(block.ravel(), minlength=len(rows) * num_patterns)
+    return counts.reshape(len(rows), num_patterns)
+
+
+def entropies(patterns, candidates, rows=None, chunk_size=2048, num_patterns=feedback.NUM_PATTERNS):
+    ''' Return the expected information (in bits) of each guess row over candidates '''
+    if rows is None:
+        rows = np.arange(patterns.shape[0])
+    result = np.empty(len(rows), dtype=np.float64)
+    n_candidates = len(candidates)
+    for start in range(0, len(rows), chunk_size):
+        counts = pattern_counts(patterns, rows[start:start + chunk_size], candidates, num_patterns)
+        probabilities = counts / n_candidates
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = np.where(counts > 0, probabilities * np.log2(probabilities), 0.0)
+        result[start:start + chunk_size] = -terms.sum(axis=1)
+    return result
+
+
+def worst_case_sizes(patterns, candidates, rows=None, chunk_size=2048, num_patterns=feedback.NUM_PATTERNS):
+    ''' Return the size of the largest group of candidates each guess row can leave '''
+    if rows is None:
+        rows = np.arange(patterns.shape[0])
+    result = np.empty(len(rows), dtype=np.int64)
+    for start in range(0, len(rows), chunk_size):
+        result[start:start + chunk_size] = pattern_counts(patterns, rows[start:start + chunk_size], candidates,
+                                                                    num_patterns).max(axis=1)
+    return result
+
+
+# Memory-mapped tables opened by pool workers, keyed by path
+_worker_tables = {}
+
+
+def _best_in_range(args):
+    ''' Pool worker: return (entropy, row) of the best opening guess in a row range '''
+    path, start, stop, n_answers, num_patterns = args
+    if path not in _worker_tables:
+        _worker_tables[path] = np.load(path, mmap_mode="r")
+    scores = entropies(_worker_tables[path], np.arange(n_answers), rows=np.arange(start, stop),
+                       num_patterns=num_patterns)
+    best = int(np.argmax(scores))
+    return float(scores[best]), start + best
+
+
+def find_opening_guess(table, processes=None):
+    '''
+    Search every guess for the best opening word. The rows are split across a
+    multiprocessing pool; each worker memory-maps the table file itself, so
+    only the row ranges are sent between processes.
+    '''
+    n_guesses = len(table.guesses)
+    if table.path is None or processes == 1:
+        scores = entropies(table.patterns, np.arange(len(table.answers)), num_patterns=table.num_patterns)
+        best = int(np.argmax(scores))
+        return table.guesses[best], float(scores[best])
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    # Use a few chunks per process so faster workers pick up the slack
+    n_chunks = processes * 4
+    bounds = np.linspace(0, n_guesses, n_chunks + 1, dtype=int)
+    jobs = [(table.path, int(start), int(stop), len(table.answers), table.num_patterns)
+            for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(_best_in_range, jobs)
+    best_entropy, best_row = max(results)
+    return table.guesses[best_row], best_entropy
+
+
+# The game finds the opening guess on a background thread, so only one
+# thread searches for it
+_opening_lock = threading.Lock()
+
+
+def get_opening_guess(table, cache_dir=cfg.CACHE_DIR, processes=None):
+    ''' Return the opening guess for this table's word lists, cached on disk '''
+    path = os.path.join(cache_dir, f"opening_{table.digest}.json")
+    with _opening_lock:
+        if os.path.exists(path):
+            with open(path, "r") as a_file:
+                return json.load(a_file)["guess"]
+
+        guess, entropy = find_opening_guess(table, processes=processes)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as a_file:
+            json.dump({"guess": guess, "entropy": entropy}, a_file)
+        os.replace(tmp_path, path)
+    return guess
+
+
+class Solver:
+    '''
+    Tracks the answers still consistent with the feedback so far and
+    suggests the guess with the highest expected information.
+    '''
+    def __init__(self, table=None):
+        self.table = table if table is not None else feedback.get_feedback_table()
+        self.reset()
+
+
+    def reset(self):
+        ''' Start again with every answer as a candidate '''
+        self.candidates = np.arange(len(self.table.answers))
+        # Number of engine guesses already applied, and the guess list they
+        # came from (a new game creates a new list; see sync)
+        self.applied = 0
+        self.history = None
+
+
+    def update(self, guess, states):
+        ''' Keep only the candidates that would have given this feedback '''
+        row = self.table.guess_index[guess.lower()]
+        pattern = feedback.encode(states)
+        self.candidates = self.candidates[self.table.patterns[row, self.candidates] == pattern]
+        self.applied += 1
+
+
+    def sync(self, engine):
+        ''' Apply any guesses made in a WordleEngine since the last call '''
+        if engine.guesses is not self.history:
+            self.reset()
+            self.history = engine.guesses
+        for guess, states in zip(engine.guesses[self.applied:], engine.feedback[self.applied:]):
+            self.update(guess, states)
+
+
+    def candidate_words(self):
+        return [self.table.answers[i] for i in self.candidates]
+
+
+    def best_guess(self, rows=None):
+        '''
+        Return the suggested next guess (lower case). rows limits it to those
+        guess rows, e.g. the guesses hard mode allows.
+        '''
+        if len(self.candidates) == 0 or (rows is not None and len(rows) == 0):
+            return None
+        if rows is None:
+            if len(self.candidates) <= 2:
+                # Guessing a candidate can win outright and loses nothing
+                return self.table.answers[self.candidates[0]]
+            if len(self.candidates) == len(self.table.answers):
+                return get_opening_guess(self.table)
+            rows = np.arange(len(self.table.guesses))
+
+        # Candidates that can be guessed
+        candidate_rows = [self.table.guess_index[word] for word in self.candidate_words()
+                          if word in self.table.guess_index]
+        is_candidate = np.isin(rows, candidate_rows)
+        if len(self.candidates) <= 2 and is_candidate.any():
+            return self.table.guesses[rows[int(np.argmax(is_candidate))]]
+
+        scores = entropies(self.table.patterns, self.candidates, rows=rows, num_patterns=self.table.num_patterns)
+        # Break ties in favour of words that could be the answer
+        scores[is_candidate] += 1 / len(self.candidates)
+        return self.table.guesses[rows[int(np.argmax(scores))]]
+
+
+def entropy_strategy(solver=None):
+    ''' Return an engine.simulate strategy that plays the solver's suggestions '''
+    if solver is None:
+        solver = Solver()
+
+    def strategy(engine):
+        solver.sync(engine)
+        return solver.best_guess()
+    return strategy
+
+
+# Letters used for each feedback state on the command line
+FEEDBACK_LETTERS = {"g": engine.CORRECT, "y": engine.PRESENT, ".": engine.ABSENT}
+
+
+def parse_guess(text, word_length):
+    ''' Parse "crane:..y.g" into ("crane", [feedback states]) '''
+    guess, _, letters = text.lower().partition(":")
+    if len(guess) != word_length or len(letters) != word_length or set(letters) - set(FEEDBACK_LETTERS):
+        raise ValueError(f"{text!r} should be a {word_length} letter guess, a colon and "
+                         f"{word_length} of {''.join(FEEDBACK_LETTERS)}")
+    return guess, [FEEDBACK_LETTERS[letter] for letter in letters]
+
+
+def main(argv=None):
+    from . import dictionary
+    from . import variants
+    parser = argparse.ArgumentParser(description="Suggest the next guess from the feedback so far")
+    parser.add_argument("guesses", nargs="*", metavar="GUESS:FEEDBACK",
+                        help="a guess and its feedback, e.g. crane:..y.g (g green, y yellow, . grey)")
+    parser.add_argument("--variant", default=variants.CLASSIC.name, choices=sorted(variants.VARIANTS))
+    parser.add_argument("--show", type=int, default=10, help="list the candidates when there are at most this many")
+    args = parser.parse_args(argv)
+
+    variant = variants.get_variant(args.variant)
+    error = variants.word_list_error(variant)
+    if error is not None:
+        parser.error(error)
+    solver = Solver(feedback.get_feedback_table(dictionary.get_dictionary(variant)))
+    for text in args.guesses:
+        try:
+            guess, states = parse_guess(text, variant.word_length)
+        except ValueError as error:
+            parser.error(str(error))
+        if guess not in solver.table.guess_index:
+            parser.error(f"{guess!r} is not an allowed guess")
+        solver.update(guess, states)
+
+    candidates = solver.candidate_words()
+    if not candidates:
+        print("No answers fit that feedback")
+        return 1
+    print(f"{len(candidates)} possible answer{'s' if len(candidates) != 1 else ''}"
+          + (f": {' '.join(candidates)}" if len(candidates) <= args.show else ""))
+    print(f"Try {solver.best_guess()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
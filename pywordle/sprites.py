@@ -0,0 +1,212 @@
+import pygame
+from . import config as cfg
+from . import glyphs
+          
+            
+def draw_tile(surface, rect, colour, glyph=None, letter_scale=1.0):
+    '''
+    Draw a tile filling rect. glyph is the (surface, (width, height)) of its
+    letter from glyphs.atlas, or None for an empty tile. letter_scale squashes
+    the letter vertically, which is used when pre-rendering tile flips.
+    '''
+    if colour is None:
+        # The tile entry hasn't been checked yet so we don't need a fill colour
+        pygame.draw.rect(surface, cfg.WHITE, rect, 2)
+    else:
+        # We need to fill the rectangle with the appropriate colour
+        pygame.draw.rect(surface, colour, rect)
+        
+    if glyph is not None:
+        # We want to draw the letter on the tile, if it exists
+        rendered_letter, (font_width, font_height) = glyph
+        if letter_scale != 1.0:
+            font_height = int(font_height * letter_scale)
+            rendered_letter = pygame.transform.scale(rendered_letter, (font_width, font_height))
+        # Get the coordinates for the top-left of the centred letter
+        font_x = rect.x + (rect.width / 2) - (font_width / 2)
+        font_y = rect.y + (rect.height / 2) - (font_height / 2)
+        surface.blit(rendered_letter, (font_x, font_y))
+
+
+class Tile:
+    def __init__(self, x, y, size=None, letter="", colour=None):
+        # x and y are coordinates of the top-left point of the pygame Rect
+        self.x = x
+        self.y = y
+        self.letter = letter
+        self.colour = colour
+        
+        if size is None:
+            size = cfg.TILESIZE
+        self.width = size
+        self.height = size
+        
+        self.font_size = glyphs.tile_font_size(size)
+        self.create_font()
+        # Animation state: a frame sheet being played over the tile (see
+        # animations.FrameSheet) and a horizontal offset used by the row shake
+        self.frames = None
+        self.frame_index = 0
+        self.offset_x = 0
+        # The area this tile last covered on screen, which must be cleared
+        # when the tile is redrawn (see Game.draw)
+        self.drawn_rect = self.rect
+        self.dirty = True
+        
+        
+    @property
+    def letter(self):
+        return self._letter
+    
+    
+    @letter.setter
+    def letter(self, value):
+        # Only changes need a redraw
+        if not hasattr(self, "_letter") or value != self._letter:
+            self._letter = value
+            # Any frames being played show the old letter
+            self.frames = None
+            self.dirty = True
+    
+    
+    @property
+    def colour(self):
+        return self._colour
+    
+    
+    @colour.setter
+    def colour(self, value):
+        if not hasattr(self, "_colour") or value != self._colour:
+            self._colour = value
+            self.dirty = True
+    
+    
+    @property
+    def rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+        
+        
+    def resize(self, x, y, size):
+        ''' Move the tile and change its size, for a new window layout '''
+        self.x = x
+        self.y = y
+        self.width = size
+        self.height = size
+        self.font_size = glyphs.tile_font_size(size)
+        self.create_font()
+        # Any frames being played were rendered at the old size
+        self.frames = None
+        self.drawn_rect = self.rect
+        self.dirty = True
+    
+    
+    def set_frame(self, frames, index):
+        ''' Show frame index of an animation frame sheet instead of the tile at rest '''
+        if frames is not self.frames or index != self.frame_index:
+            self.frames = frames
+            self.frame_index = index
+            self.dirty = True
+    
+    
+    def clear_frames(self, frames=None):
+        ''' Stop showing animation frames (only if they are still frames, when given) '''
+        if self.frames is not None and (frames is None or frames is self.frames):
+            self.frames = None
+            self.dirty = True
+    
+    
+    def set_offset(self, offset_x):
+        if offset_x != self.offset_x:
+            self.offset_x = offset_x
+            self.dirty = True
+        
+        
+    def create_font(self):
+        # The rendered letter and its size in px come from the shared glyph cache
+        self.rendered_letter, (self.font_width, self.font_height) = glyphs.atlas.render(self.letter, self.font_size)
+        
+        
+    def draw(self, screen):
+        self.dirty = False
+        if self.frames is not None:
+            self.drawn_rect = self.frames.blit(screen, self.x + self.offset_x, self.y, self.frame_index)
+            return
+        rect = self.rect.move(self.offset_x, 0)
+        glyph = (self.rendered_letter, (self.font_width, self.font_height)) if self.letter != "" else None
+        draw_tile(screen, rect, self.colour, glyph)
+        self.drawn_rect = rect
+            
+
+class UIElement:
+    ''' Fading text for messages shown on game board '''
+    def __init__(self, x, y, text, text_colour, font_size=40):
+        self.x = x
+        self.y = y
+        self.text = text
+        self.text_colour = text_colour
+        self.font_size = font_size
+        self.alpha = 0.0
+        self.create_font()
+        self.dirty = True
+        
+        
+    @property
+    def alpha(self):
+        return self._alpha
+    
+    
+    @alpha.setter
+    def alpha(self, value):
+        # Fading only needs a redraw while the alpha is actually changing
+        if not hasattr(self, "_alpha") or value != self._alpha:
+            self._alpha = value
+            self.dirty = True
+    
+    
+    @property
+    def rect(self):
+        return pygame.Rect(self.x, self.y, *self.text_surface.get_size())
+        
+        
+    def create_font(self):
+        self.original_surface, _ = glyphs.atlas.render_message(self.text, self.font_size, self.text_colour)
+        self.text_surface = self.original_surface.copy()
+        # This surface is used to adjust the alpha of self.text_surface
+        self.alpha_surface = pygame.Surface(self.text_surface.get_size(), pygame.SRCALPHA)
+    
+    
+    def draw(self, screen):
+        self.dirty = False
+        self.text_surface = self.original_surface.copy()
+        self.alpha_surface.fill((255, 255, 255, self.alpha))
+        self.text_surface.blit(self.alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        screen.blit(self.text_surface, (self.x, self.y))
+        
+    
+    def fade(self, fade_dir):
+        ''' Adjust the self.alpha value to fade the text out '''
+        if fade_dir == "out":
+            self.alpha = max(self.alpha - 10, 0)
+        elif fade_dir == "in":
+            self.alpha = min(self.alpha + 10, 255)
+        self.text_surface = self.original_surface.copy()
+        self.alpha_surface.fill((255, 255, 255, self.alpha))
+        self.text_surface.blit(self.alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        
+        
+    def get_text_width(self):
+        return self.text_surface.get_width()
+    
+    
+    def set_text(self, text):
+        ''' Change the message, keeping the current position and alpha '''
+        if text != self.text:
+            self.text = text
+            self.create_font()
+            self.dirty = True
+    
+    
+    def set_pos(self, new_x_pos, new_y_pos):
+        self.x = new_x_pos
+        self.y = new_y_pos
+        self.dirty = True
\ No newline at end of file
@@ -0,0 +1,248 @@
+'''
+Player profiles and game history, stored in SQLite. Finished games are
+queued by the frame loop and written by a background thread in batches, so
+saving never blocks a frame. Each game is one row in the games table.
+Running totals, streaks and guess distributions are kept up to date in the
+players and distributions tables as games are saved, so reading them is a
+primary key lookup however many games are stored.
+
+    python -m pywordle stats                  # summary and guess distribution for the default player
+    python -m pywordle stats --player alice
+'''
+import argparse
+import collections
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from . import config as cfg
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0,
+    max_streak INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    finished_at REAL NOT NULL,
+    word TEXT NOT NULL,
+    guesses TEXT NOT NULL,
+    num_guesses INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    hard_mode INTEGER NOT NULL DEFAULT 0
+);
+-- A player's games in the order they were played
+CREATE INDEX IF NOT EXISTS games_history ON games (player_id, id);
+CREATE TABLE IF NOT EXISTS distributions (
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    won INTEGER NOT NULL,
+    num_guesses INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (player_id, won, num_guesses)
+) WITHOUT ROWID;
+'''
+
+
+class GameResult:
+    ''' One finished game, as queued for saving '''
+    __slots__ = ("player", "word", "guesses", "won", "duration", "hard_mode", "finished_at")
+
+    def __init__(self, player, word, guesses, won, duration, hard_mode=False, finished_at=None):
+        self.player = player
+        self.word = word
+        self.guesses = list(guesses)
+        self.won = won
+        self.duration = duration
+        self.hard_mode = hard_mode
+        self.finished_at = finished_at if finished_at is not None else time.time()
+
+
+def apply_result(summary, won):
+    ''' Update a summary dict (games, wins, current_streak, max_streak) with one game '''
+    summary["games"] += 1
+    if won:
+        summary["wins"] += 1
+        summary["current_streak"] += 1
+        summary["max_streak"] = max(summary["max_streak"], summary["current_streak"])
+    else:
+        summary["current_streak"] = 0
+
+
+def connect(path):
+    connection = sqlite3.connect(path)
+    # Readers don't block the writer thread, and vice versa
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class StatsStore:
+    '''
+    Queues finished games and saves them on a background thread. record()
+    only puts the result on a queue; the writer thread takes everything
+    queued (up to batch_size games) and saves it in one transaction. Queries
+    run on the calling thread's own connection.
+    '''
+    def __init__(self, path=cfg.STATS_DB_PATH, batch_size=cfg.STATS_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        # Create the schema before anything reads from it
+        connect(path).close()
+        self.connection = None
+        # Games the writer thread couldn't save (e.g. the database was locked
+        # or read-only). They are reported on stderr and dropped
+        self.failed = 0
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, name="stats-writer", daemon=True)
+        self.writer.start()
+
+
+    def record(self, result):
+        ''' Queue a GameResult to be saved. Never blocks '''
+        self.queue.put(result)
+
+
+    def flush(self):
+        ''' Wait until every queued game has been saved '''
+        self.queue.join()
+
+
+    def close(self):
+        ''' Save any queued games and stop the writer thread. self.failed counts games that couldn't be saved '''
+        self.queue.put(None)
+        self.writer.join()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+    def write_loop(self):
+        connection = connect(self.path)
+        player_ids = {}
+        running = True
+        while running:
+            # Wait for one game, then take whatever else is already queued
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                running = False
+            results = [result for result in batch if result is not None]
+            try:
+                if results:
+                    self.save(connection, results, player_ids)
+            except Exception as error:
+                # Keep the thread alive for later games. The transaction was
+                # rolled back, so player ids cached during it may not exist
+                player_ids.clear()
+                self.failed += len(results)
+                print(f"Could not save {len(results)} game(s) to {self.path}: {error}", file=sys.stderr)
+            finally:
+                # flush() must return even if the batch wasn't saved
+                for _ in batch:
+                    self.queue.task_done()
+        connection.close()
+
+
+    def save(self, connection, results, player_ids):
+        ''' Insert a batch of games and update each player's totals, in one transaction '''
+        with connection:
+            summaries = {}
+            counts = collections.Counter()
+            for result in results:
+                if result.player not in summaries:
+                    if result.player not in player_ids:
+                        connection.execute("INSERT OR IGNORE INTO players (name) VALUES (?)", (result.player,))
+                    row = connection.execute("SELECT id, games, wins, current_streak, max_streak FROM players "
+                                             "WHERE name = ?", (result.player,)).fetchone()
+                    player_ids[result.player] = row[0]
+                    summaries[result.player] = dict(zip(("games", "wins", "current_streak", "max_streak"), row[1:]))
+                apply_result(summaries[result.player], result.won)
+                counts[player_ids[result.player], int(result.won), len(result.guesses)] += 1
+
+            connection.executemany(
+                "INSERT INTO games (player_id, finished_at, word, guesses, num_guesses, won, duration, hard_mode) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(player_ids[result.player], result.finished_at, result.word.lower(),
+                  " ".join(guess.lower() for guess in result.guesses), len(result.guesses),
+                  int(result.won), result.duration, int(result.hard_mode)) for result in results])
+            connection.executemany(
+                "UPDATE players SET games = ?, wins = ?, current_streak = ?, max_streak = ? WHERE id = ?",
+                [(summary["games"], summary["wins"], summary["current_streak"], summary["max_streak"],
+                  player_ids[player]) for player, summary in summaries.items()])
+            connection.executemany(
+                "INSERT INTO distributions (player_id, won, num_guesses, count) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (player_id, won, num_guesses) DO UPDATE SET count = count + excluded.count",
+                [key + (count,) for key, count in counts.items()])
+
+
+    def reader(self):
+        ''' Connection for queries from the thread that created the store '''
+        if self.connection is None:
+            self.connection = connect(self.path)
+        return self.connection
+
+
+    def summary(self, player):
+        ''' Return the player's games, wins, current_streak and max_streak '''
+        row = self.reader().execute("SELECT games, wins, current_streak, max_streak FROM players WHERE name = ?",
+                                    (player,)).fetchone()
+        return dict(zip(("games", "wins", "current_streak", "max_streak"), row or (0, 0, 0, 0)))
+
+
+    def distribution(self, player, max_guesses=cfg.NUM_ROWS):
+        ''' Return a list where [n] counts wins in n guesses and [0] counts losses '''
+        distribution = [0] * (max_guesses + 1)
+        rows = self.reader().execute(
+            "SELECT won, num_guesses, count FROM distributions "
+            "WHERE player_id = (SELECT id FROM players WHERE name = ?)", (player,))
+        for won, num_guesses, count in rows:
+            if not won:
+                distribution[0] += count
+            elif num_guesses <= max_guesses:
+                distribution[num_guesses] += count
+        return distribution
+
+
+    def recent_games(self, player, limit=10):
+        ''' Return the player's last games, newest first '''
+        rows = self.reader().execute(
+            "SELECT finished_at, word, guesses, won, duration, hard_mode FROM games "
+            "WHERE player_id = (SELECT id FROM players WHERE name = ?) ORDER BY id DESC LIMIT ?", (player, limit))
+        return [{"finished_at": finished_at, "word": word, "guesses": guesses.split(), "won": bool(won),
+                 "duration": duration, "hard_mode": bool(hard_mode)}
+                for finished_at, word, guesses, won, duration, hard_mode in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show a player's saved game stats")
+    parser.add_argument("--player", default=cfg.DEFAULT_PLAYER)
+    parser.add_argument("--db", default=cfg.STATS_DB_PATH)
+    args = parser.parse_args(argv)
+
+    store = StatsStore(args.db)
+    summary = store.summary(args.player)
+    win_rate = summary["wins"] / summary["games"] if summary["games"] else 0.0
+    print(f"{args.player}: {summary['games']} played, {win_rate:.0%} won, "
+          f"current streak {summary['current_streak']}, max streak {summary['max_streak']}")
+    distribution = store.distribution(args.player)
+    for n, count in enumerate(distribution[1:], 1):
+        print(f"{n}: {count}")
+    print(f"X: {distribution[0]}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
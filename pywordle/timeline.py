@@ -0,0 +1,81 @@
+'''
+A small tween scheduler. Game.update advances the timeline by the time since
+the last frame, so any number of animations can run at once (for example
+the staggered tile flips of a row) without blocking the event loop. Nothing
+here depends on pygame, so the timeline can also be driven headlessly.
+'''
+
+
+class Tween:
+    '''
+    Calls on_update(progress) with progress going from 0 to 1 over duration
+    seconds, after waiting delay seconds, then calls on_complete().
+    '''
+    def __init__(self, duration, on_update=None, on_complete=None, delay=0.0):
+        self.duration = duration
+        self.on_update = on_update
+        self.on_complete = on_complete
+        self.delay = delay
+        self.elapsed = 0.0
+        self.finished = False
+
+
+    def advance(self, dt):
+        ''' Move the tween on by dt seconds. Returns True once it has finished '''
+        self.elapsed += dt
+        if self.elapsed < self.delay:
+            return False
+        progress = min((self.elapsed - self.delay) / self.duration, 1.0) if self.duration > 0 else 1.0
+        if self.on_update is not None:
+            self.on_update(progress)
+        if progress >= 1.0:
+            self.finish()
+        return self.finished
+
+
+    def finish(self):
+        if not self.finished:
+            self.finished = True
+            if self.on_complete is not None:
+                self.on_complete()
+
+
+class Timeline:
+    def __init__(self):
+        self.tweens = []
+
+
+    def add(self, duration, on_update=None, on_complete=None, delay=0.0):
+        ''' Schedule a new tween and return it '''
+        tween = Tween(duration, on_update, on_complete, delay)
+        self.tweens.append(tween)
+        return tween
+
+
+    def update(self, dt):
+        ''' Advance every running tween by dt seconds and drop the finished ones '''
+        # Callbacks may schedule new tweens, which start on the next update
+        for tween in list(self.tweens):
+            if not tween.finished:
+                tween.advance(dt)
+        self.tweens = [tween for tween in self.tweens if not tween.finished]
+
+
+    def finish_all(self):
+        ''' Jump every running tween (and any they schedule) to its end '''
+        while self.tweens:
+            tweens, self.tweens = self.tweens, []
+            for tween in tweens:
+                if tween.on_update is not None and not tween.finished:
+                    tween.on_update(1.0)
+                tween.finish()
+
+
+    def clear(self):
+        ''' Drop every tween without calling its callbacks '''
+        self.tweens = []
+
+
+    @property
+    def active(self):
+        return bool(self.tweens)
@@ -0,0 +1,103 @@
+'''
+Game variants: word length, number of guesses, number of boards played at
+once (as in Dordle and Quordle) and the word lists to use. Nothing here
+loads any words; a variant's dictionary, word pack and indexes are loaded
+the first time a game of that variant is started, and variants with the
+same word lists share them.
+'''
+import os
+from . import config as cfg
+
+
+class Variant:
+    def __init__(self, name, word_length, max_guesses, boards=1, answer_path=None, valid_path=None, pack_path=None):
+        self.name = name
+        self.word_length = word_length
+        self.max_guesses = max_guesses
+        self.boards = boards
+        # Word lists for other lengths follow the naming of the generated pack
+        self.answer_path = answer_path or os.path.join(cfg.DATA_DIR, f"answers_{word_length}.txt")
+        self.valid_path = valid_path or os.path.join(cfg.DATA_DIR, f"valid_{word_length}.txt")
+        self.pack_path = pack_path or os.path.join(cfg.DATA_DIR, f"words_{word_length}.bin")
+
+
+    def missing_word_lists(self, need_text=False):
+        '''
+        Return the paths of the word lists this variant needs but doesn't
+        have. The text lists aren't needed once the word pack is built,
+        unless need_text is set (to build the pack).
+        '''
+        if not need_text and os.path.exists(self.pack_path):
+            return []
+        return [path for path in (self.answer_path, self.valid_path) if not os.path.exists(path)]
+
+
+    def __repr__(self):
+        return f"Variant({self.name!r}, {self.word_length} letters, {self.max_guesses} guesses, {self.boards} boards)"
+
+
+VARIANTS = {}
+
+
+def register(variant):
+    VARIANTS[variant.name] = variant
+    return variant
+
+
+def get_variant(name):
+    try:
+        return VARIANTS[name]
+    except KeyError:
+        raise ValueError(f"Unknown variant {name!r}; choose from {', '.join(sorted(VARIANTS))}") from None
+
+
+CLASSIC = register(Variant("classic", cfg.NUM_COLS, cfg.NUM_ROWS, answer_path=cfg.GAME_WORD_LIST_PATH,
+                           valid_path=cfg.VALID_WORD_LIST_PATH, pack_path=cfg.WORD_PACK_PATH))
+# Multi-board modes use the classic word lists
+register(Variant("dordle", cfg.NUM_COLS, 7, boards=2, answer_path=cfg.GAME_WORD_LIST_PATH,
+                 valid_path=cfg.VALID_WORD_LIST_PATH, pack_path=cfg.WORD_PACK_PATH))
+register(Variant("quordle", cfg.NUM_COLS, 9, boards=4, answer_path=cfg.GAME_WORD_LIST_PATH,
+                 valid_path=cfg.VALID_WORD_LIST_PATH, pack_path=cfg.WORD_PACK_PATH))
+# Other word lengths need data/answers_<n>.txt and data/valid_<n>.txt
+for word_length in (4, 6, 7, 8):
+    register(Variant(f"wordle{word_length}", word_length, max(cfg.NUM_ROWS, word_length + 1)))
+
+
+def word_list_error(variant, need_text=False):
+    ''' Return a command line error naming a variant's missing word lists, or None if it has them '''
+    missing = variant.missing_word_lists(need_text)
+    if not missing:
+        return None
+    return (f"variant {variant.name!r} needs its word lists, one word per line: "
+            f"{', '.join(os.path.relpath(path, cfg.ROOT_DIR) for path in missing)} not found")
+
+
+def board_grid(boards):
+    ''' (columns, rows) of boards: side by side for two, a 2x2 grid for four '''
+    columns = min(boards, 2)
+    return columns, (boards + columns - 1) // columns
+
+
+def board_layout(variant):
+    '''
+    Return (tile size, gap size, [(x, y) of each board's top-left tile]).
+    Tiles keep the classic proportions of tile to gap and are as large as
+    possible (up to the classic size) while every board fits in the board
+    area, and the boards are centred in it.
+    '''
+    columns, rows = board_grid(variant.boards)
+    classic_step = cfg.TILESIZE + cfg.GAPSIZE
+    area_width = cfg.WIDTH - 2 * cfg.BOARD_AREA_SIDE
+    step = min(classic_step,
+               (area_width - (columns - 1) * cfg.BOARD_GAP) // (columns * variant.word_length),
+               (cfg.BOARD_AREA_HEIGHT - (rows - 1) * cfg.BOARD_GAP) // (rows * variant.max_guesses))
+    tilesize = step * cfg.TILESIZE // classic_step
+    gapsize = step - tilesize
+
+    board_width = variant.word_length * step
+    board_height = variant.max_guesses * step
+    left = (cfg.WIDTH - (columns * board_width + (columns - 1) * cfg.BOARD_GAP)) // 2
+    top = cfg.BOARD_AREA_TOP + (cfg.BOARD_AREA_HEIGHT - (rows * board_height + (rows - 1) * cfg.BOARD_GAP)) // 2
+    origins = [(left + (i % columns) * (board_width + cfg.BOARD_GAP), top + (i // columns) * (board_height + cfg.BOARD_GAP))
+               for i in range(variant.boards)]
+    return tilesize, gapsize, origins
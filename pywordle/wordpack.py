@@ -0,0 +1,161 @@
+'''
+Compact binary word list. Both text word lists are compiled into a single
+file that is memory-mapped on startup, so worker processes share its pages
+and nothing has to be re-split or re-indexed from text. The file holds:
+
+    header          magic, version, word length, counts, and the size and
+                    mtime of each source text file (to detect a stale pack)
+    records         every allowed word, sorted, as fixed-width ASCII records
+    flags           one byte per word: FLAG_VALID_LIST and/or FLAG_ANSWER
+    answer order    uint32 record index of each answer, in word list order
+    letter index    for each (position, letter) a bitset over the records,
+                    with bit i set if word i has that letter at that position
+
+Build it with: python -m pywordle pack (add --variant NAME for other word lengths)
+If the pack is missing or older than the text files, the text files are used.
+'''
+import mmap
+import os
+import struct
+import sys
+from . import config as cfg
+
+
+MAGIC = b"PYWL"
+VERSION = 1
+# magic, version, word length, word count, answer count, then size and
+# mtime_ns of the answer list and of the valid word list
+HEADER = struct.Struct("<4sHHII4Q")
+
+FLAG_VALID_LIST = 1
+FLAG_ANSWER = 2
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+
+def source_stamp(path):
+    ''' (size, mtime_ns) of a source file, used to detect a stale pack '''
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def bitset_bytes(n_words):
+    return (n_words + 7) // 8
+
+
+def build_pack(answers, valid_words, path=cfg.WORD_PACK_PATH,
+               answer_path=cfg.GAME_WORD_LIST_PATH, valid_path=cfg.VALID_WORD_LIST_PATH):
+    ''' Compile the word lists into a pack file at path '''
+    answers = [word.lower() for word in answers]
+    valid_list = set(word.lower() for word in valid_words)
+    words = sorted(valid_list | set(answers))
+    word_length = len(words[0])
+    if any(len(word) != word_length for word in words):
+        raise ValueError("Every word in a pack must have the same length")
+    position = {word: i for i, word in enumerate(words)}
+    answer_set = set(answers)
+
+    flags = bytes((FLAG_VALID_LIST if word in valid_list else 0) | (FLAG_ANSWER if word in answer_set else 0)
+                  for word in words)
+    answer_order = struct.pack(f"<{len(answers)}I", *(position[word] for word in answers))
+
+    # Build each (position, letter) bitset as a Python int, then store it in
+    # little-endian byte order so bit i of the int is word i
+    n_bytes = bitset_bytes(len(words))
+    bitsets = [0] * (word_length * len(ALPHABET))
+    for i, word in enumerate(words):
+        for pos, letter in enumerate(word):
+            bitsets[pos * len(ALPHABET) + ALPHABET.index(letter)] |= 1 << i
+    letter_index = b"".join(bitset.to_bytes(n_bytes, "little") for bitset in bitsets)
+
+    header = HEADER.pack(MAGIC, VERSION, word_length, len(words), len(answers),
+                         *source_stamp(answer_path), *source_stamp(valid_path))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as a_file:
+        a_file.write(header)
+        a_file.write("".join(words).encode("ascii"))
+        a_file.write(flags)
+        a_file.write(answer_order)
+        a_file.write(letter_index)
+    os.replace(tmp_path, path)
+
+
+class WordPack:
+    ''' Read-only view of a memory-mapped pack file '''
+    def __init__(self, path):
+        with open(path, "rb") as a_file:
+            self.buffer = mmap.mmap(a_file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.word_length, self.n_words, self.n_answers,
+         *self.stamps) = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} word pack")
+        # Offsets of each section
+        self.records_offset = HEADER.size
+        self.flags_offset = self.records_offset + self.n_words * self.word_length
+        self.answers_offset = self.flags_offset + self.n_words
+        self.index_offset = self.answers_offset + 4 * self.n_answers
+        self.bitset_size = bitset_bytes(self.n_words)
+
+
+    def is_stale(self, answer_path=cfg.GAME_WORD_LIST_PATH, valid_path=cfg.VALID_WORD_LIST_PATH):
+        ''' Return True if either text file has changed since the pack was built '''
+        try:
+            return tuple(self.stamps) != source_stamp(answer_path) + source_stamp(valid_path)
+        except OSError:
+            # The text files are optional once the pack exists
+            return False
+
+
+    def words(self):
+        ''' Return every word, in record (sorted) order '''
+        records = self.buffer[self.records_offset:self.flags_offset].decode("ascii")
+        length = self.word_length
+        return [records[i:i + length] for i in range(0, len(records), length)]
+
+
+    def answer_indices(self):
+        ''' Record index of each answer, in the original word list order '''
+        return struct.unpack_from(f"<{self.n_answers}I", self.buffer, self.answers_offset)
+
+
+    def letter_bitset(self, position, letter):
+        ''' Return the bitset (as an int) of words with letter at position '''
+        start = self.index_offset + (position * len(ALPHABET) + ALPHABET.index(letter)) * self.bitset_size
+        return int.from_bytes(self.buffer[start:start + self.bitset_size], "little")
+
+
+def load_pack(path=cfg.WORD_PACK_PATH, answer_path=cfg.GAME_WORD_LIST_PATH, valid_path=cfg.VALID_WORD_LIST_PATH):
+    ''' Return the WordPack at path, or None if it is missing, invalid or stale '''
+    if not os.path.exists(path):
+        return None
+    try:
+        pack = WordPack(path)
+    except (OSError, ValueError, struct.error):
+        return None
+    if pack.is_stale(answer_path, valid_path):
+        return None
+    return pack
+
+
+def main(argv=None):
+    import argparse
+    from . import dictionary
+    from . import variants
+    parser = argparse.ArgumentParser(description="Compile the text word lists into a binary word pack")
+    parser.add_argument("--variant", default=variants.CLASSIC.name, choices=sorted(variants.VARIANTS))
+    parser.add_argument("--output", help="pack file to write (default: the variant's pack path)")
+    args = parser.parse_args(argv)
+    variant = variants.get_variant(args.variant)
+    error = variants.word_list_error(variant, need_text=True)
+    if error is not None:
+        parser.error(error)
+    if args.output is None:
+        args.output = variant.pack_path
+    build_pack(dictionary.load_game_word_list(variant.answer_path), dictionary.load_valid_word_list(variant.valid_path),
+               args.output, variant.answer_path, variant.valid_path)
+    pack = WordPack(args.output)
+    print(f"Wrote {pack.n_words} words ({pack.n_answers} answers) to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()